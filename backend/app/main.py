@@ -91,6 +91,11 @@ async def lifespan(app: FastAPI):
         await shutdown_notifier()
         logger.info("✅ Notifier shutdown")
 
+        # Close the browser shared by the scrapers
+        from app.scrapers.google_flights import shutdown_browser
+        await shutdown_browser()
+        logger.info("✅ Scraper browser closed")
+
     except Exception as e:
         logger.error(f"❌ Shutdown error: {e}")
 
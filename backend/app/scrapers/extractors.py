@@ -12,23 +12,34 @@ Principles:
 5. Never fail completely - extract what we can
 """
 
+import os
 import re
+import random
+import asyncio
+import functools
+import itertools
 import logging
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, Iterator, AsyncIterator
 from decimal import Decimal
-from playwright.async_api import Page, ElementHandle
+from playwright.async_api import Page, ElementHandle, JSHandle, Error as PlaywrightError
 
 logger = logging.getLogger(__name__)
 
+# Attach a per-flight extraction_summary dict (diagnostic, off by default)
+EMIT_EXTRACTION_SUMMARY = os.environ.get("EMIT_EXTRACTION_SUMMARY", "").lower() in ("1", "true", "yes")
+
 
 # =============================================================================
 # Validation Rules
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Result of validating extracted data."""
+    """Result of validating extracted data (slotted: built for every candidate element).
+
+    Frozen, as cached validators hand the same instance to every caller.
+    """
     is_valid: bool
     value: Any
     confidence: float  # 0.0 to 1.0
@@ -43,7 +54,25 @@ class PriceValidator:
     MAX_PRICE = 50000    # Maximum reasonable flight price
 
     # Suspicious prices that are likely UI elements, not flight prices
-    SUSPICIOUS_PRICES = {1, 2, 3, 4, 5, 10, 100, 1000, 10000}
+    SUSPICIOUS_PRICES = frozenset({1, 2, 3, 4, 5, 10, 100, 1000, 10000})
+
+    @classmethod
+    def confidence(cls, price: int) -> float:
+        """
+        Confidence for a price, or 0.0 if validate() would reject it.
+
+        Cheap pre-check for hot loops: no ValidationResult is built, so
+        callers can discard rejected matches without allocating.
+        """
+        if price < cls.MIN_PRICE or price > cls.MAX_PRICE or price in cls.SUSPICIOUS_PRICES:
+            return 0.0
+
+        # Typical international flights: 300-5000
+        if 200 <= price <= 8000:
+            return 0.95
+        if 100 <= price <= 15000:
+            return 0.8
+        return 0.6
 
     @classmethod
     def validate(cls, price: int, context: Dict[str, Any] = None) -> ValidationResult:
@@ -81,19 +110,10 @@ class PriceValidator:
                 reason=f"Price {price} is suspiciously round"
             )
 
-        # Calculate confidence based on price range
-        # Typical international flights: 300-5000
-        if 200 <= price <= 8000:
-            confidence = 0.95
-        elif 100 <= price <= 15000:
-            confidence = 0.8
-        else:
-            confidence = 0.6
-
         return ValidationResult(
             is_valid=True,
             value=price,
-            confidence=confidence,
+            confidence=cls.confidence(price),
             reason="Price within expected range"
         )
 
@@ -101,8 +121,8 @@ class PriceValidator:
 class AirlineValidator:
     """Validate extracted airline names."""
 
-    # Known airlines (subset - expand as needed)
-    KNOWN_AIRLINES = {
+    # Known airlines, lower-case (subset - expand as needed)
+    KNOWN_AIRLINES = frozenset({
         # Major international
         "air new zealand", "qantas", "virgin australia", "jetstar",
         "singapore airlines", "cathay pacific", "emirates", "qatar airways",
@@ -114,18 +134,18 @@ class AirlineValidator:
         # Low-cost carriers
         "airasia", "scoot", "cebu pacific", "spring airlines",
         "indigo", "spicejet", "lion air", "vietjet",
-    }
+    })
 
-    # Patterns that indicate airline names
-    AIRLINE_PATTERNS = [
-        r"(?:air|airlines?|airways?)\b",
-        r"\b(?:fly|jet|star)\b",
-    ]
+    # Known airlines ordered by length for the partial-match scan
+    _KNOWN_BY_LEN = tuple(sorted(KNOWN_AIRLINES, key=lambda name: (len(name), name)))
+
+    # Airline-like words, as one alternation so a name is scanned once
+    AIRLINE_PATTERN = re.compile(r"(?:air|airlines?|airways?)\b|\b(?:fly|jet|star)\b")
 
     @classmethod
     def validate(cls, airline: str) -> ValidationResult:
         """Validate an airline name."""
-        if not airline or airline.lower() == "unknown":
+        if not airline:
             return ValidationResult(
                 is_valid=False,
                 value=airline,
@@ -133,53 +153,81 @@ class AirlineValidator:
                 reason="Empty or unknown airline"
             )
 
-        airline_lower = airline.lower().strip()
+        return _validate_airline_normalized(airline, airline.lower().strip())
 
-        # Check known airlines
-        if airline_lower in cls.KNOWN_AIRLINES:
-            return ValidationResult(
-                is_valid=True,
-                value=airline,
-                confidence=0.95,
-                reason="Known airline"
-            )
 
-        # Check partial matches
-        for known in cls.KNOWN_AIRLINES:
-            if known in airline_lower or airline_lower in known:
-                return ValidationResult(
-                    is_valid=True,
-                    value=airline,
-                    confidence=0.85,
-                    reason=f"Partial match with {known}"
-                )
+@functools.lru_cache(maxsize=1024)
+def _validate_airline_normalized(airline: str, airline_lower: str) -> ValidationResult:
+    """
+    Validate an airline name the caller has already lower-cased and stripped.
 
-        # Check patterns
-        for pattern in cls.AIRLINE_PATTERNS:
-            if re.search(pattern, airline_lower):
-                return ValidationResult(
-                    is_valid=True,
-                    value=airline,
-                    confidence=0.7,
-                    reason="Matches airline pattern"
-                )
+    Memoized at module level: the same few carrier names recur across every
+    row and strategy, so the partial-match scan runs once per distinct name.
+    The shared ValidationResult is frozen.
 
-        # Unknown but could still be valid
-        if 2 <= len(airline) <= 50:
+    Args:
+        airline: The airline name as extracted (returned as the value)
+        airline_lower: The same name, lower-cased and stripped
+    """
+    if not airline_lower or airline_lower == "unknown":
+        return ValidationResult(
+            is_valid=False,
+            value=airline,
+            confidence=0.0,
+            reason="Empty or unknown airline"
+        )
+
+    # Check known airlines
+    if airline_lower in AirlineValidator.KNOWN_AIRLINES:
+        return ValidationResult(
+            is_valid=True,
+            value=airline,
+            confidence=0.95,
+            reason="Known airline"
+        )
+
+    # Check partial matches. A known name can only be contained in the
+    # input if it is no longer than it, and vice versa, so each known
+    # name needs just one substring check.
+    airline_len = len(airline_lower)
+    for known in AirlineValidator._KNOWN_BY_LEN:
+        if len(known) <= airline_len:
+            matched = known in airline_lower
+        else:
+            matched = airline_lower in known
+        if matched:
             return ValidationResult(
                 is_valid=True,
                 value=airline,
-                confidence=0.5,
-                reason="Unknown airline, reasonable length"
+                confidence=0.85,
+                reason=f"Partial match with {known}"
             )
 
+    # Check patterns
+    if AirlineValidator.AIRLINE_PATTERN.search(airline_lower):
         return ValidationResult(
-            is_valid=False,
+            is_valid=True,
             value=airline,
-            confidence=0.1,
-            reason="Does not match airline patterns"
+            confidence=0.7,
+            reason="Matches airline pattern"
         )
 
+    # Unknown but could still be valid
+    if 2 <= len(airline) <= 50:
+        return ValidationResult(
+            is_valid=True,
+            value=airline,
+            confidence=0.5,
+            reason="Unknown airline, reasonable length"
+        )
+
+    return ValidationResult(
+        is_valid=False,
+        value=airline,
+        confidence=0.1,
+        reason="Does not match airline patterns"
+    )
+
 
 class StopsValidator:
     """Validate number of stops."""
@@ -274,9 +322,230 @@ class DurationValidator:
 # Extraction Strategies
 # =============================================================================
 
-@dataclass
+# Confidence penalty per fallback level (lower levels are more reliable)
+_LEVEL_PENALTIES = (0.0, 0.05, 0.10, 0.15, 0.20, 0.25)
+
+# Reads an element's text and the attributes the parsers use. Every in-page
+# probe below builds its element records with this, so the fields stay in sync
+_ELEMENT_RECORD_JS = """el => ({
+    text: el.innerText || '',
+    aria: el.getAttribute('aria-label') || '',
+    alt: el.getAttribute('alt') || '',
+    data_price: el.getAttribute('data-price') || '',
+    data_value: el.getAttribute('data-value') || '',
+    data_gs: el.getAttribute('data-gs') || '',
+})"""
+
+# Used with eval_on_selector_all: records for at most `limit` matched
+# elements, pruned in-page, in one call
+_ELEMENT_FIELDS_JS = """
+(elements, limit) => elements.slice(0, limit).map(""" + _ELEMENT_RECORD_JS + """)
+"""
+
+# One querySelectorAll over the union of several strategies' plain-CSS
+# selectors. Each element goes to the first selector it matches, and up to
+# `limit` element records per selector are returned as one list per
+# selector, in selector order.
+_STRATEGY_PROBE_JS = """
+([selectors, limit]) => {
+    const record = """ + _ELEMENT_RECORD_JS + """;
+    const buckets = selectors.map(() => []);
+    for (const el of document.querySelectorAll(selectors.join(', '))) {
+        const index = selectors.findIndex(selector => el.matches(selector));
+        if (index < 0 || buckets[index].length >= limit) continue;
+        buckets[index].push(record(el));
+    }
+    return buckets;
+}
+"""
+
+# Stops text patterns (case-insensitive, so callers needn't lower-case)
+_NONSTOP_RE = re.compile(r'nonstop|non-stop|direct', re.IGNORECASE)
+_STOPS_COUNT_RE = re.compile(r'(\d+)\s*stop', re.IGNORECASE)
+
+# Airline name cleanup, removed in one pass: a leading carrier prefix, flight
+# numbers (upper-case only) and clock times
+_AIRLINE_NOISE_RE = re.compile(
+    r'(?i:^(?:Operated by|Marketed by|Flights? on)\s*)'
+    r'|\b[A-Z]{2}\d+\b'
+    r'|(?i:\d{1,2}:\d{2}(?:\s*(?:AM|PM))?)'
+)
+
+# Duration formats: "5h 30m" / "5 hr 30 min", "5h" / "5 hours", "5:30"
+_DURATION_HM_RE = re.compile(r'(\d+)\s*h(?:r|our)?s?\s*(\d+)\s*m', re.IGNORECASE)
+_DURATION_H_RE = re.compile(r'(\d+)\s*h(?:r|our)?s?(?!\s*\d)', re.IGNORECASE)
+_DURATION_CLOCK_RE = re.compile(r'(\d{1,2}):(\d{2})')
+
+
+# Longest text memoized by _memoize_short_text; longer texts (whole
+# containers' innerText) rarely repeat and would bloat the cache
+_MAX_MEMOIZED_TEXT = 200
+
+
+def _memoize_short_text(maxsize: int):
+    """
+    lru_cache a one-string-argument parser, for texts up to _MAX_MEMOIZED_TEXT.
+
+    Longer texts are parsed without touching the cache. The wrapper keeps
+    cache_info()/cache_clear() from the underlying lru_cache.
+    """
+    def decorator(func):
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+
+        @functools.wraps(func)
+        def wrapper(text):
+            if text and len(text) > _MAX_MEMOIZED_TEXT:
+                return func(text)
+            return cached(text)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+
+def _has_currency_marker(text: str) -> bool:
+    """
+    True if text has a marker every PriceExtractor.PRICE_PATTERNS entry needs.
+
+    Plain substring checks, several times faster than a regex scan, so most
+    non-price text is ruled out before any pattern runs.
+    """
+    return '$' in text or 'NZD' in text or 'AUD' in text or '€' in text or '£' in text
+
+
+def _is_css_selector(selector: str) -> bool:
+    """Return True if a selector is plain CSS (usable with Element.matches())."""
+    return not selector.startswith("text=") and ":has-text(" not in selector
+
+
+# Playwright's `tag:has-text('x')`, split into tag and text
+_HAS_TEXT_RE = re.compile(r"^([\w-]*):has-text\((['\"])(.*)\2\)$")
+
+
+def _group_strategies_by_level(
+    strategies: List[Dict[str, Any]],
+) -> Tuple[Tuple[int, List[Dict[str, Any]], List[Dict[str, Any]]], ...]:
+    """
+    Group strategies by fallback level, in ascending level order.
+
+    Each level is split into strategies queried together as one selector
+    union in-page and Playwright-only text= strategies that have to be
+    queried individually. A `tag:has-text('x')` strategy joins the union as
+    its tag, with the text kept under "has_text" for an in-page check.
+
+    Returns:
+        Tuple of (level, css_strategies, engine_strategies)
+    """
+    levels: Dict[int, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+    for strategy in strategies:
+        css, engine = levels.setdefault(strategy["level"], ([], []))
+        has_text = _HAS_TEXT_RE.match(strategy["selector"])
+        if has_text:
+            css.append({
+                **strategy,
+                "selector": has_text.group(1) or "*",
+                "has_text": has_text.group(3),
+            })
+        elif _is_css_selector(strategy["selector"]):
+            css.append(strategy)
+        else:
+            engine.append(strategy)
+    return tuple((level, css, engine) for level, (css, engine) in sorted(levels.items()))
+
+
+def _split_has_text(selectors: List[str]) -> Tuple[str, List[List[str]]]:
+    """
+    Split selectors into a plain-CSS union and Playwright `tag:has-text('x')`
+    selectors, the latter returned as [tag, text] pairs for in-page checks.
+    """
+    css = []
+    text_checks = []
+    for selector in selectors:
+        match = _HAS_TEXT_RE.match(selector)
+        if match:
+            text_checks.append([match.group(1), match.group(3)])
+        else:
+            css.append(selector)
+    return ", ".join(css), text_checks
+
+
+def _row_level_unions(
+    strategies: List[Dict[str, Any]],
+) -> Tuple[Tuple[int, str, Optional[str]], ...]:
+    """
+    Collapse row strategies into one (level, name, selector union) per level.
+
+    Names of merged strategies are joined with '+'. Strategies without a
+    selector (DOM traversal) keep their own entry with a None selector.
+    """
+    levels: Dict[int, Tuple[List[str], List[str]]] = {}
+    special = []
+    for strategy in strategies:
+        if strategy["selector"] is None:
+            special.append((strategy["level"], strategy["name"], None))
+            continue
+        names, selectors = levels.setdefault(strategy["level"], ([], []))
+        names.append(strategy["name"])
+        selectors.append(strategy["selector"])
+
+    unions = [
+        (level, "+".join(names), ", ".join(selectors))
+        for level, (names, selectors) in levels.items()
+    ]
+    return tuple(sorted(unions + special, key=lambda entry: entry[0]))
+
+
+# Month names used to detect date context around bare numbers
+_MONTH_RE = re.compile(
+    r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?'
+    r'|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?'
+    r'|Dec(?:ember)?)\b',
+    re.IGNORECASE,
+)
+
+
+def _looks_like_year_in_date(number: int, text: str) -> bool:
+    """
+    Return True if `number` appears to be a calendar year inside date text.
+
+    A bare number in the 2020-2035 range is likely a year when the
+    surrounding text contains month names (e.g. "Mar 15, 2026").
+    Legitimate prices at $2026 would have been caught earlier by
+    currency-symbol patterns ($, NZ$, etc.) and never reach the
+    emergency fallback.
+    """
+    return 2020 <= number <= 2035 and _MONTH_RE.search(text) is not None
+
+
+async def _unpack_element_array(handle: JSHandle) -> List[ElementHandle]:
+    """Turn a JS array-of-elements handle into element handles, then dispose it."""
+    try:
+        properties = await handle.get_properties()
+        elements = []
+        for index in sorted((key for key in properties if key.isdigit()), key=int):
+            element = properties[index].as_element()
+            if element:
+                elements.append(element)
+        return elements
+    finally:
+        await handle.dispose()
+
+
+# Row probe candidates: (selector, fallback level, element text/attributes)
+_Candidates = List[Tuple[str, int, Dict[str, str]]]
+
+
+def _row_probe_arg(
+    fields: Tuple[Tuple[str, Tuple[Tuple[str, int], ...], int], ...],
+) -> List[List[Any]]:
+    """Build the JSON argument for the in-page row probe from (field, selectors, limit)."""
+    return [[name, [selector for selector, _ in selectors], limit] for name, selectors, limit in fields]
+
+
+@dataclass(slots=True)
 class ExtractionResult:
-    """Result of an extraction attempt."""
+    """Result of an extraction attempt (slotted: built for every candidate element)."""
     success: bool
     value: Any
     confidence: float
@@ -335,15 +604,15 @@ class PriceExtractor:
         {"name": "all-spans", "selector": "span", "level": 5},  # Scan all spans
     ]
 
-    # Price extraction regex patterns
+    # Price extraction regex patterns, compiled once and tried in priority order
     PRICE_PATTERNS = [
-        (r'NZ\$\s*([\d,]+)', "NZD prefix"),
-        (r'AU\$\s*([\d,]+)', "AUD prefix"),
-        (r'\$\s*([\d,]+)', "Dollar prefix"),
-        (r'([\d,]+)\s*NZD', "NZD suffix"),
-        (r'([\d,]+)\s*AUD', "AUD suffix"),
-        (r'€\s*([\d,]+)', "Euro"),
-        (r'£\s*([\d,]+)', "Pound"),
+        (re.compile(r'NZ\$\s*([\d,]+)'), "NZD prefix"),
+        (re.compile(r'AU\$\s*([\d,]+)'), "AUD prefix"),
+        (re.compile(r'\$\s*([\d,]+)'), "Dollar prefix"),
+        (re.compile(r'([\d,]+)\s*NZD'), "NZD suffix"),
+        (re.compile(r'([\d,]+)\s*AUD'), "AUD suffix"),
+        (re.compile(r'€\s*([\d,]+)'), "Euro"),
+        (re.compile(r'£\s*([\d,]+)'), "Pound"),
         # Bare number regex REMOVED -- was matching flight numbers, seat IDs,
         # and other non-price numbers. Emergency fallback is now only used
         # within RowExtractor for elements with price-context indicators.
@@ -351,46 +620,121 @@ class PriceExtractor:
 
     # Emergency fallback: only used within per-row extraction for elements
     # that have price-related ARIA labels or class names
-    EMERGENCY_PRICE_PATTERN = (r'\b(\d{3,5})\b', "Bare number (emergency)")
+    EMERGENCY_PRICE_PATTERN = (re.compile(r'\b(\d{3,5})\b'), "Bare number (emergency)")
+
+    # Elements read per strategy (pruned in-page)
+    MAX_ELEMENTS_PER_STRATEGY = 50
+
+    # Stop trying lower levels once this many prices at or above this
+    # confidence have been found (the current DOM is clearly matching)
+    EARLY_EXIT_MIN_RESULTS = 5
+    EARLY_EXIT_MIN_CONFIDENCE = 0.9
+
+    # Strategies grouped by level, see _group_strategies_by_level()
+    _STRATEGY_LEVELS = _group_strategies_by_level(STRATEGIES)
+
+    # In-page probe for one level: a single querySelectorAll over the union of
+    # the level's CSS selectors. Each element is tagged with the first strategy
+    # it matches (capped per strategy) and returned as [strategy name, element
+    # record]. has_text strategies also need the text (case-insensitive, as
+    # Playwright's :has-text does).
+    _LEVEL_PROBE_JS = """
+    ([strategies, limit]) => {
+        const record = """ + _ELEMENT_RECORD_JS + """;
+        const union = strategies.map(s => s.selector).join(', ');
+        const counts = {};
+        const records = [];
+        for (const el of document.querySelectorAll(union)) {
+            const strategy = strategies.find(s =>
+                el.matches(s.selector) &&
+                (!s.has_text ||
+                    (el.textContent || '').toLowerCase().includes(s.has_text.toLowerCase()))
+            );
+            if (!strategy) continue;
+            counts[strategy.name] = (counts[strategy.name] || 0) + 1;
+            if (counts[strategy.name] > limit) continue;
+            records.push([strategy.name, record(el)]);
+        }
+        return records;
+    }
+    """
 
     @classmethod
     async def extract(cls, page: Page) -> List[ExtractionResult]:
         """
         Extract all prices from the page using fallback strategies.
 
+        Strategies on the same level are resolved with one in-page query;
+        Playwright-only text= selectors are still queried one by one.
+        Remaining levels are skipped once enough high-confidence prices
+        have been found.
+
         Returns list of ExtractionResults sorted by confidence.
         """
         results = []
         seen_prices = set()
+        # The same price text recurs across DOM sections and strategies; it
+        # always parses to the same price, which seen_prices would drop, so
+        # each distinct text is parsed only once
+        seen_texts = set()
 
-        for strategy in cls.STRATEGIES:
-            try:
-                elements = await page.query_selector_all(strategy["selector"])
-
-                for element in elements[:50]:  # Limit per strategy
-                    try:
-                        extraction = await cls._extract_from_element(
-                            element,
-                            strategy["name"],
-                            strategy["level"]
+        for level, css_strategies, engine_strategies in cls._STRATEGY_LEVELS:
+            extractions = []
+
+            if css_strategies:
+                try:
+                    records = await page.evaluate(
+                        cls._LEVEL_PROBE_JS, [css_strategies, cls.MAX_ELEMENTS_PER_STRATEGY]
+                    )
+                    for strategy_name, fields in records:
+                        combined_text = cls._combined_price_text(fields)
+                        if combined_text in seen_texts:
+                            continue
+                        seen_texts.add(combined_text)
+                        extractions.append(
+                            cls._parse_price_text(combined_text, strategy_name, level)
                         )
+                except PlaywrightError as e:
+                    logger.debug(f"Level {level} selector union failed: {e}")
 
-                        if extraction and extraction.success:
-                            price = extraction.value
-                            if price not in seen_prices:
-                                seen_prices.add(price)
-                                results.append(extraction)
-                                logger.debug(
-                                    f"Price {price} extracted via {strategy['name']} "
-                                    f"(level {strategy['level']}, confidence {extraction.confidence:.2f})"
-                                )
-                    except Exception as e:
-                        logger.debug(f"Element extraction failed: {e}")
+            for strategy in engine_strategies:
+                try:
+                    records = await page.eval_on_selector_all(
+                        strategy["selector"], _ELEMENT_FIELDS_JS, cls.MAX_ELEMENTS_PER_STRATEGY
+                    )
+                except PlaywrightError as e:
+                    logger.debug(f"Strategy {strategy['name']} failed: {e}")
+                    continue
+
+                for fields in records:
+                    combined_text = cls._combined_price_text(fields)
+                    if combined_text in seen_texts:
                         continue
+                    seen_texts.add(combined_text)
+                    extractions.append(
+                        cls._parse_price_text(combined_text, strategy["name"], level)
+                    )
 
-            except Exception as e:
-                logger.debug(f"Strategy {strategy['name']} failed: {e}")
-                continue
+            for extraction in extractions:
+                if extraction and extraction.success:
+                    price = extraction.value
+                    if price not in seen_prices:
+                        seen_prices.add(price)
+                        results.append(extraction)
+                        logger.debug(
+                            f"Price {price} extracted via {extraction.strategy_name} "
+                            f"(level {level}, confidence {extraction.confidence:.2f})"
+                        )
+
+            high_confidence = sum(
+                1 for r in results if r.confidence >= cls.EARLY_EXIT_MIN_CONFIDENCE
+            )
+            if high_confidence >= cls.EARLY_EXIT_MIN_RESULTS:
+                logger.debug(
+                    f"{high_confidence} high-confidence prices after level {level}, "
+                    f"skipping remaining strategies"
+                )
+                break
 
         # Sort by confidence (highest first)
         results.sort(key=lambda x: x.confidence, reverse=True)
@@ -407,54 +751,55 @@ class PriceExtractor:
 
         return results
 
+    @staticmethod
+    def _combined_price_text(fields: Dict[str, str]) -> str:
+        """Join an element's text and price-bearing attributes for pattern matching."""
+        return (
+            f"{fields['text']} {fields['aria']} {fields['data_price']} "
+            f"{fields['data_value']} {fields['data_gs']}"
+        )
+
     @classmethod
-    async def _extract_from_element(
+    def _parse_price_text(
         cls,
-        element: ElementHandle,
+        combined_text: str,
         strategy_name: str,
         level: int
     ) -> Optional[ExtractionResult]:
-        """Extract price from a single element."""
-        # Get text content
-        text = await element.inner_text() or ""
-
-        # Also check aria-label
-        aria = await element.get_attribute("aria-label") or ""
-
-        # Check data attributes
-        data_price = await element.get_attribute("data-price")
-        data_value = await element.get_attribute("data-value")
-        data_gs = await element.get_attribute("data-gs")
-
-        combined_text = f"{text} {aria} {data_price or ''} {data_value or ''} {data_gs or ''}"
+        """Parse and validate a price from an element's combined text and attributes."""
+        if not _has_currency_marker(combined_text):
+            return None
 
-        # Try each pattern
+        # Strip thousands separators once, then try each pattern
+        cleaned_text = combined_text.replace(',', '')
         for pattern, pattern_name in cls.PRICE_PATTERNS:
-            match = re.search(pattern, combined_text.replace(',', ''))
+            match = pattern.search(cleaned_text)
             if match:
-                try:
-                    price = int(match.group(1).replace(',', ''))
-
-                    # Validate
-                    validation = PriceValidator.validate(price)
-
-                    if validation.is_valid:
-                        # Adjust confidence based on extraction level
-                        level_penalty = level * 0.05  # Lower levels are more reliable
-                        confidence = min(validation.confidence - level_penalty, 0.99)
+                # With commas stripped the group is all digits, so int() can't fail
+                price = int(match.group(1))
 
-                        return ExtractionResult(
-                            success=True,
-                            value=price,
-                            confidence=confidence,
-                            strategy_name=strategy_name,
-                            fallback_level=level,
-                            raw_text=combined_text[:100],
-                            validation=validation
-                        )
-                except ValueError:
+                # Most matches on broad levels are rejected; skip
+                # building their ValidationResult
+                if not PriceValidator.confidence(price):
                     continue
 
+                validation = PriceValidator.validate(price)
+
+                if validation.is_valid:
+                    # Adjust confidence based on extraction level
+                    level_penalty = _LEVEL_PENALTIES[level]  # Lower levels are more reliable
+                    confidence = min(validation.confidence - level_penalty, 0.99)
+
+                    return ExtractionResult(
+                        success=True,
+                        value=price,
+                        confidence=confidence,
+                        strategy_name=strategy_name,
+                        fallback_level=level,
+                        raw_text=combined_text[:100],
+                        validation=validation
+                    )
+
         return None
 
 
@@ -463,6 +808,14 @@ class FlightDetailsExtractor:
     Extract airline, stops, and duration with 10+ fallback strategies each.
     """
 
+    # Elements read per strategy (pruned in-page)
+    MAX_ELEMENTS_PER_STRATEGY = 20
+
+    # Stop trying lower levels once this many results at or above this
+    # confidence have been found (same rule as PriceExtractor)
+    EARLY_EXIT_MIN_RESULTS = 5
+    EARLY_EXIT_MIN_CONFIDENCE = 0.9
+
     # Airline extraction strategies
     AIRLINE_STRATEGIES = [
         {"name": "aria-airline", "selector": "[aria-label*='airline']", "level": 0},
@@ -505,81 +858,110 @@ class FlightDetailsExtractor:
         {"name": "itinerary-time", "selector": "[class*='itinerary'] [class*='time']", "level": 4},
     ]
 
-    # Duration parsing patterns
-    DURATION_PATTERNS = [
-        (r'(\d+)\s*h(?:r|our)?s?\s*(\d+)\s*m(?:in)?', "hours and minutes"),
-        (r'(\d+)\s*h(?:r|our)?s?', "hours only"),
-        (r'(\d+)\s*m(?:in(?:ute)?s?)?', "minutes only"),
-        (r'(\d{1,2}):(\d{2})', "HH:MM format"),
-    ]
+    @classmethod
+    async def _iter_strategies(
+        cls, page: Page, strategies: List[Dict[str, Any]]
+    ) -> AsyncIterator[Tuple[Dict[str, Any], List[Dict[str, str]]]]:
+        """
+        Yield each strategy with its matched element fields, in strategy order.
 
-    # Stops parsing patterns
-    STOPS_PATTERNS = [
-        (r'(\d+)\s*stop', "N stops"),
-        (r'nonstop|non-stop|direct', "nonstop"),
-    ]
+        Plain-CSS strategies are all read up front by one in-page probe;
+        Playwright-only selectors (text=) are read one call each as they are
+        reached, so a caller that stops early skips them. A strategy whose
+        read fails yields no elements.
+        """
+        css_indexes = [
+            index for index, strategy in enumerate(strategies)
+            if _is_css_selector(strategy["selector"])
+        ]
+        css_records: Dict[int, List[Dict[str, str]]] = {}
+
+        if css_indexes:
+            try:
+                buckets = await page.evaluate(
+                    _STRATEGY_PROBE_JS,
+                    [[strategies[i]["selector"] for i in css_indexes], cls.MAX_ELEMENTS_PER_STRATEGY],
+                )
+                css_records = dict(zip(css_indexes, buckets))
+            except PlaywrightError as e:
+                logger.debug(f"Strategy probe failed: {e}")
+
+        for index, strategy in enumerate(strategies):
+            if index in css_indexes:
+                yield strategy, css_records.get(index, [])
+                continue
+            try:
+                records = await page.eval_on_selector_all(
+                    strategy["selector"], _ELEMENT_FIELDS_JS, cls.MAX_ELEMENTS_PER_STRATEGY
+                )
+            except PlaywrightError:
+                records = []
+            yield strategy, records
+
+    @classmethod
+    def _has_enough_results(cls, results: List[ExtractionResult]) -> bool:
+        """True once enough high-confidence results make lower levels unnecessary."""
+        high_confidence = sum(
+            1 for r in results if r.confidence >= cls.EARLY_EXIT_MIN_CONFIDENCE
+        )
+        return high_confidence >= cls.EARLY_EXIT_MIN_RESULTS
 
     @classmethod
     async def extract_airline(cls, page: Page) -> List[ExtractionResult]:
         """Extract airline names from page."""
         results = []
         seen = set()
+        level = None
 
-        for strategy in cls.AIRLINE_STRATEGIES:
-            try:
-                elements = await page.query_selector_all(strategy["selector"])
-
-                for element in elements[:20]:
-                    try:
-                        text = await element.inner_text() or ""
-                        aria = await element.get_attribute("aria-label") or ""
-                        alt = await element.get_attribute("alt") or ""
-
-                        combined = f"{text} {aria} {alt}".strip()
-
-                        # Clean up the airline name
-                        airline = cls._clean_airline_name(combined)
-
-                        if airline and airline.lower() not in seen:
-                            seen.add(airline.lower())
-
-                            validation = AirlineValidator.validate(airline)
-
-                            if validation.is_valid:
-                                level_penalty = strategy["level"] * 0.05
-                                confidence = max(validation.confidence - level_penalty, 0.1)
-
-                                results.append(ExtractionResult(
-                                    success=True,
-                                    value=airline,
-                                    confidence=confidence,
-                                    strategy_name=strategy["name"],
-                                    fallback_level=strategy["level"],
-                                    raw_text=combined[:100],
-                                    validation=validation
-                                ))
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+        async for strategy, records in cls._iter_strategies(page, cls.AIRLINE_STRATEGIES):
+            # Strategies are in level order; stop before a lower level once
+            # the levels so far have produced enough
+            if strategy["level"] != level:
+                if cls._has_enough_results(results):
+                    break
+                level = strategy["level"]
+
+            for fields in records:
+                combined = f"{fields['text']} {fields['aria']} {fields['alt']}".strip()
+
+                # Clean up the airline name
+                airline = cls._clean_airline_name(combined)
+
+                if not airline:
+                    continue
+
+                airline_lower = airline.lower()
+                if airline_lower not in seen:
+                    seen.add(airline_lower)
+
+                    validation = _validate_airline_normalized(airline, airline_lower)
+
+                    if validation.is_valid:
+                        level_penalty = _LEVEL_PENALTIES[strategy["level"]]
+                        confidence = max(validation.confidence - level_penalty, 0.1)
+
+                        results.append(ExtractionResult(
+                            success=True,
+                            value=airline,
+                            confidence=confidence,
+                            strategy_name=strategy["name"],
+                            fallback_level=strategy["level"],
+                            raw_text=combined[:100],
+                            validation=validation
+                        ))
 
         results.sort(key=lambda x: x.confidence, reverse=True)
         return results
 
-    @classmethod
-    def _clean_airline_name(cls, text: str) -> Optional[str]:
-        """Clean and extract airline name from text."""
+    @staticmethod
+    @_memoize_short_text(maxsize=4096)
+    def _clean_airline_name(text: str) -> Optional[str]:
+        """Clean and extract airline name from text (memoized; labels repeat across rows)."""
         if not text:
             return None
 
-        # Remove common prefixes
-        text = re.sub(r'^(Operated by|Marketed by|Flights? on)\s*', '', text, flags=re.I)
-
-        # Remove flight numbers
-        text = re.sub(r'\b[A-Z]{2}\d+\b', '', text)
-
-        # Remove times
-        text = re.sub(r'\d{1,2}:\d{2}(\s*(AM|PM))?', '', text, flags=re.I)
+        # Remove common prefixes, flight numbers and times
+        text = _AIRLINE_NOISE_RE.sub('', text)
 
         # Clean whitespace
         text = ' '.join(text.split()).strip()
@@ -594,52 +976,49 @@ class FlightDetailsExtractor:
     async def extract_stops(cls, page: Page) -> List[ExtractionResult]:
         """Extract stops count from page."""
         results = []
+        level = None
 
-        for strategy in cls.STOPS_STRATEGIES:
-            try:
-                elements = await page.query_selector_all(strategy["selector"])
-
-                for element in elements[:20]:
-                    try:
-                        text = await element.inner_text() or ""
-                        aria = await element.get_attribute("aria-label") or ""
-
-                        combined = f"{text} {aria}".lower()
-
-                        # Check for nonstop
-                        if re.search(r'nonstop|non-stop|direct', combined):
-                            validation = StopsValidator.validate(0)
-                            results.append(ExtractionResult(
-                                success=True,
-                                value=0,
-                                confidence=0.95 - strategy["level"] * 0.05,
-                                strategy_name=strategy["name"],
-                                fallback_level=strategy["level"],
-                                raw_text=combined[:50],
-                                validation=validation
-                            ))
-                            continue
+        async for strategy, records in cls._iter_strategies(page, cls.STOPS_STRATEGIES):
+            # Strategies are in level order; stop before a lower level once
+            # the levels so far have produced enough
+            if strategy["level"] != level:
+                if cls._has_enough_results(results):
+                    break
+                level = strategy["level"]
+
+            for fields in records:
+                combined = f"{fields['text']} {fields['aria']}"
+
+                # Check for nonstop
+                if _NONSTOP_RE.search(combined):
+                    validation = StopsValidator.validate(0)
+                    results.append(ExtractionResult(
+                        success=True,
+                        value=0,
+                        confidence=0.95 - _LEVEL_PENALTIES[strategy["level"]],
+                        strategy_name=strategy["name"],
+                        fallback_level=strategy["level"],
+                        raw_text=combined[:50],
+                        validation=validation
+                    ))
+                    continue
 
-                        # Check for N stops
-                        match = re.search(r'(\d+)\s*stop', combined)
-                        if match:
-                            stops = int(match.group(1))
-                            validation = StopsValidator.validate(stops)
-
-                            if validation.is_valid:
-                                results.append(ExtractionResult(
-                                    success=True,
-                                    value=stops,
-                                    confidence=validation.confidence - strategy["level"] * 0.05,
-                                    strategy_name=strategy["name"],
-                                    fallback_level=strategy["level"],
-                                    raw_text=combined[:50],
-                                    validation=validation
-                                ))
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+                # Check for N stops
+                match = _STOPS_COUNT_RE.search(combined)
+                if match:
+                    stops = int(match.group(1))
+                    validation = StopsValidator.validate(stops)
+
+                    if validation.is_valid:
+                        results.append(ExtractionResult(
+                            success=True,
+                            value=stops,
+                            confidence=validation.confidence - _LEVEL_PENALTIES[strategy["level"]],
+                            strategy_name=strategy["name"],
+                            fallback_level=strategy["level"],
+                            raw_text=combined[:50],
+                            validation=validation
+                        ))
 
         results.sort(key=lambda x: x.confidence, reverse=True)
         return results
@@ -648,59 +1027,57 @@ class FlightDetailsExtractor:
     async def extract_duration(cls, page: Page) -> List[ExtractionResult]:
         """Extract flight duration from page."""
         results = []
+        level = None
 
-        for strategy in cls.DURATION_STRATEGIES:
-            try:
-                elements = await page.query_selector_all(strategy["selector"])
-
-                for element in elements[:20]:
-                    try:
-                        text = await element.inner_text() or ""
-                        aria = await element.get_attribute("aria-label") or ""
-
-                        combined = f"{text} {aria}"
-
-                        duration = cls._parse_duration(combined)
-
-                        if duration:
-                            validation = DurationValidator.validate(duration)
-
-                            if validation.is_valid:
-                                results.append(ExtractionResult(
-                                    success=True,
-                                    value=duration,
-                                    confidence=validation.confidence - strategy["level"] * 0.05,
-                                    strategy_name=strategy["name"],
-                                    fallback_level=strategy["level"],
-                                    raw_text=combined[:50],
-                                    validation=validation
-                                ))
-                    except Exception:
-                        continue
-            except Exception:
-                continue
+        async for strategy, records in cls._iter_strategies(page, cls.DURATION_STRATEGIES):
+            # Strategies are in level order; stop before a lower level once
+            # the levels so far have produced enough
+            if strategy["level"] != level:
+                if cls._has_enough_results(results):
+                    break
+                level = strategy["level"]
+
+            for fields in records:
+                combined = f"{fields['text']} {fields['aria']}"
+
+                duration = cls._parse_duration(combined)
+
+                if duration:
+                    validation = DurationValidator.validate(duration)
+
+                    if validation.is_valid:
+                        results.append(ExtractionResult(
+                            success=True,
+                            value=duration,
+                            confidence=validation.confidence - _LEVEL_PENALTIES[strategy["level"]],
+                            strategy_name=strategy["name"],
+                            fallback_level=strategy["level"],
+                            raw_text=combined[:50],
+                            validation=validation
+                        ))
 
         results.sort(key=lambda x: x.confidence, reverse=True)
         return results
 
-    @classmethod
-    def _parse_duration(cls, text: str) -> Optional[int]:
-        """Parse duration text to minutes."""
+    @staticmethod
+    @_memoize_short_text(maxsize=4096)
+    def _parse_duration(text: str) -> Optional[int]:
+        """Parse duration text to minutes (memoized; formats repeat across rows)."""
         if not text:
             return None
 
         # Try hours and minutes: "5h 30m", "5 hr 30 min", etc.
-        match = re.search(r'(\d+)\s*h(?:r|our)?s?\s*(\d+)\s*m', text, re.I)
+        match = _DURATION_HM_RE.search(text)
         if match:
             return int(match.group(1)) * 60 + int(match.group(2))
 
         # Try hours only: "5h", "5 hours"
-        match = re.search(r'(\d+)\s*h(?:r|our)?s?(?!\s*\d)', text, re.I)
+        match = _DURATION_H_RE.search(text)
         if match:
             return int(match.group(1)) * 60
 
         # Try HH:MM format
-        match = re.search(r'(\d{1,2}):(\d{2})', text)
+        match = _DURATION_CLOCK_RE.search(text)
         if match:
             hours, mins = int(match.group(1)), int(match.group(2))
             if hours < 48 and mins < 60:  # Sanity check
@@ -741,70 +1118,131 @@ class FlightRowLocator:
     ]
 
     # Minimum requirements for a valid flight row
-    PRICE_INDICATORS = [
+    PRICE_INDICATORS = (
         "[aria-label*='dollar']", "[aria-label*='NZD']", "[aria-label*='price']",
         "[class*='price']", "[data-price]", "span:has-text('$')",
-    ]
+    )
 
-    AIRLINE_INDICATORS = [
+    AIRLINE_INDICATORS = (
         "[class*='carrier']", "[class*='airline']", "img[alt]",
         "[aria-label*='airline']", "[data-carrier]",
-    ]
+    )
+
+    # Price elements the level 3 traversal walks up from
+    TRAVERSAL_PRICE_SELECTORS = (
+        "[aria-label*='dollar']", "[aria-label*='NZD']",
+        "[class*='price'] span", "[data-price]",
+    )
+
+    # Candidate rows checked per level, and price elements walked up from
+    # in the traversal fallback (per selector); both pruned in-page
+    MAX_ROW_CANDIDATES = 30
+    MAX_TRAVERSAL_PRICE_ELEMENTS = 20
+
+    # Ancestors walked up from each price element looking for a row
+    MAX_ANCESTOR_DEPTH = 6
+
+    # ROW_STRATEGIES collapsed to one query per level, see _row_level_unions()
+    _LEVEL_UNIONS = _row_level_unions(ROW_STRATEGIES)
+    _PRICE_INDICATOR_CHECKS = _split_has_text(PRICE_INDICATORS)
+    # Any airline indicator, tested with one querySelector per ancestor
+    _AIRLINE_INDICATOR_UNION = ", ".join(AIRLINE_INDICATORS)
+
+    # Returns the first `limit` elements matching a level's selector that
+    # contain a price indicator. Playwright's :has-text() isn't available to
+    # querySelector, so those indicators arrive as [tag, text] pairs and are
+    # checked by hand (case-insensitive substring, as :has-text does).
+    _VALID_ROWS_JS = """
+    ([selector, limit, cssUnion, textChecks]) =>
+        Array.from(document.querySelectorAll(selector)).slice(0, limit).filter(row =>
+            (cssUnion !== '' && row.querySelector(cssUnion) !== null) ||
+            textChecks.some(([tag, text]) =>
+                Array.from(row.querySelectorAll(tag || '*')).some(el =>
+                    (el.textContent || '').toLowerCase().includes(text.toLowerCase())
+                )
+            )
+        )
+    """
 
     @classmethod
     async def find_rows(cls, page: Page) -> Tuple[List[ElementHandle], str, int]:
         """
         Find flight row containers on the page.
 
+        Each level's selectors are queried together as one union, so the
+        common case (level 0 matches) costs a single query.
+
         Returns:
             Tuple of (row_elements, strategy_name, strategy_level)
         """
-        for strategy in cls.ROW_STRATEGIES:
-            if strategy["selector"] is None:
+        for level, name, selector in cls._LEVEL_UNIONS:
+            if selector is None:
                 # Level 3: DOM traversal from price elements
                 rows = await cls._find_rows_by_price_traversal(page)
                 if rows:
                     logger.info(
                         f"FlightRowLocator: found {len(rows)} rows via "
-                        f"price-ancestor traversal (level 3)"
+                        f"price-ancestor traversal (level {level})"
                     )
-                    return rows, strategy["name"], strategy["level"]
+                    return rows, name, level
                 continue
 
             try:
-                elements = await page.query_selector_all(strategy["selector"])
-
-                # Filter to elements that look like flight rows
-                valid_rows = []
-                for el in elements[:30]:  # Cap to prevent scanning too many
-                    if await cls._is_valid_flight_row(el):
-                        valid_rows.append(el)
+                # Only elements that look like flight rows come back
+                valid_rows = await cls._query_valid_rows(page, selector)
 
                 if valid_rows:
                     logger.info(
                         f"FlightRowLocator: found {len(valid_rows)} rows via "
-                        f"{strategy['name']} (level {strategy['level']})"
+                        f"{name} (level {level})"
                     )
-                    return valid_rows, strategy["name"], strategy["level"]
+                    return valid_rows, name, level
 
-            except Exception as e:
-                logger.debug(f"FlightRowLocator strategy {strategy['name']} failed: {e}")
+            except PlaywrightError as e:
+                logger.debug(f"FlightRowLocator strategy {name} failed: {e}")
                 continue
 
         logger.warning("FlightRowLocator: no flight rows found by any strategy")
         return [], "", -1
 
     @classmethod
-    async def _is_valid_flight_row(cls, element: ElementHandle) -> bool:
-        """Check if an element looks like a flight row (has price indicator)."""
-        for selector in cls.PRICE_INDICATORS:
-            try:
-                found = await element.query_selector(selector)
-                if found:
-                    return True
-            except Exception:
-                continue
-        return False
+    async def _query_valid_rows(cls, page: Page, selector: str) -> List[ElementHandle]:
+        """Query a level's selector in-page, keeping rows that have a price indicator."""
+        css_union, text_checks = cls._PRICE_INDICATOR_CHECKS
+        handle = await page.evaluate_handle(
+            cls._VALID_ROWS_JS,
+            [selector, cls.MAX_ROW_CANDIDATES, css_union, text_checks],
+        )
+        return await _unpack_element_array(handle)
+
+    # Walks up to maxDepth ancestors from each price element (capped per selector)
+    # to the first one containing an airline indicator. Rows are deduplicated
+    # by DOM identity, so several prices in one row yield that row once.
+    _PRICE_TRAVERSAL_JS = """
+    ([priceSelectors, airlineSelector, limit, maxDepth]) => {
+        const rows = [];
+        const seen = new Set();
+        for (const selector of priceSelectors) {
+            const priceElements = Array.from(document.querySelectorAll(selector)).slice(0, limit);
+            for (const priceEl of priceElements) {
+                let current = priceEl;
+                for (let depth = 0; depth < maxDepth; depth++) {
+                    const parent = current.parentElement;
+                    if (!parent) break;
+                    if (parent.querySelector(airlineSelector)) {
+                        if (!seen.has(parent)) {
+                            seen.add(parent);
+                            rows.push(parent);
+                        }
+                        break;
+                    }
+                    current = parent;
+                }
+            }
+        }
+        return rows;
+    }
+    """
 
     @classmethod
     async def _find_rows_by_price_traversal(cls, page: Page) -> List[ElementHandle]:
@@ -813,73 +1251,118 @@ class FlightRowLocator:
 
         Strategy: find all price-containing elements, then for each,
         walk up the DOM tree to find a reasonable container that also
-        has airline/stops info.
+        has airline/stops info. The whole walk runs in one in-page call.
         """
-        rows = []
-        seen_row_ids = set()
-
-        # Find price elements first
-        price_selectors = [
-            "[aria-label*='dollar']", "[aria-label*='NZD']",
-            "[class*='price'] span", "[data-price]",
-        ]
+        try:
+            handle = await page.evaluate_handle(
+                cls._PRICE_TRAVERSAL_JS,
+                [
+                    cls.TRAVERSAL_PRICE_SELECTORS,
+                    cls._AIRLINE_INDICATOR_UNION,
+                    cls.MAX_TRAVERSAL_PRICE_ELEMENTS,
+                    cls.MAX_ANCESTOR_DEPTH,
+                ],
+            )
+        except PlaywrightError as e:
+            logger.debug(f"Price-ancestor traversal failed: {e}")
+            return []
 
-        for selector in price_selectors:
-            try:
-                price_elements = await page.query_selector_all(selector)
-                for price_el in price_elements[:20]:
-                    # Walk up to find a row-like container
-                    row = await cls._find_row_ancestor(price_el)
-                    if row:
-                        # Deduplicate by checking if we've already found this row
-                        row_text = await row.inner_text() or ""
-                        row_id = hash(row_text[:200])
-                        if row_id not in seen_row_ids:
-                            seen_row_ids.add(row_id)
-                            rows.append(row)
-            except Exception:
-                continue
+        return await _unpack_element_array(handle)
 
-        return rows
 
-    @classmethod
-    async def _find_row_ancestor(cls, element: ElementHandle) -> Optional[ElementHandle]:
-        """Walk up from a price element to find the flight row container."""
-        current = element
+class RowExtractor:
+    """
+    Extracts price, airline, stops, and duration from a single flight row element.
 
-        for _ in range(6):  # Walk up max 6 levels
-            try:
-                parent = await current.evaluate_handle("el => el.parentElement")
-                if not parent:
-                    break
+    This is the core of the per-row extraction fix. By scoping all queries to
+    a single row element, we guarantee that extracted fields belong to the same flight.
 
-                # Check if this parent has both price and airline indicators
-                has_airline = False
-                for selector in cls.AIRLINE_INDICATORS:
-                    try:
-                        found = await parent.as_element().query_selector(selector)
-                        if found:
-                            has_airline = True
-                            break
-                    except Exception:
-                        continue
+    All fields are read from the row in one in-page call. Each field is looked
+    up with one query over the union of its selectors, and candidates come back
+    in selector-priority order, so the first valid one is the same element a
+    one-query-per-selector loop would have used. Parsing and validation run
+    in Python on the returned text.
+    """
 
-                if has_airline:
-                    return parent.as_element()
+    # Row-scoped selectors per field, in priority order, with fallback level
+    PRICE_SELECTORS = (
+        ("[data-price]", 0),
+        ("[aria-label*='dollar']", 1),
+        ("[aria-label*='NZD']", 1),
+        ("[aria-label*='price']", 1),
+        ("[class*='price'] span", 2),
+        (".U3gSDe .FpEdX span", 2),  # Known Google Flights price container
+        ("[class*='price']", 2),
+    )
 
-                current = parent.as_element()
-            except Exception:
-                break
+    EMERGENCY_PRICE_SELECTORS = (
+        ("[aria-label*='dollar']", 5), ("[aria-label*='price']", 5),
+        ("[aria-label*='cost']", 5), ("[aria-label*='fare']", 5),
+        ("[class*='price']", 5), ("[class*='fare']", 5), ("[class*='cost']", 5),
+    )
 
-        return None
+    AIRLINE_SELECTORS = (
+        ("[data-carrier]", 0),
+        ("[aria-label*='airline']", 0),
+        ("[aria-label*='Operated by']", 0),
+        ("[class*='carrier']", 1),
+        ("[class*='airline']", 1),
+        ("img[alt*='Airways']", 2),
+        ("img[alt*='Airlines']", 2),
+        ("img[alt*='Air']", 2),
+        ("img[alt]", 3),
+    )
 
+    STOPS_SELECTORS = (
+        ("[aria-label*='stop']", 0),
+        ("[aria-label*='Nonstop']", 0),
+        ("[aria-label*='direct']", 0),
+        ("[class*='stop']", 1),
+        ("[data-stops]", 1),
+    )
 
-class RowExtractor:
-    """
-    Extracts price, airline, stops, and duration from a single flight row element.
+    DURATION_SELECTORS = (
+        ("[aria-label*='duration']", 0),
+        ("[aria-label*='hr']", 0),
+        ("[aria-label*='hour']", 0),
+        ("[class*='duration']", 1),
+        ("[class*='total-time']", 1),
+    )
 
-    This is the core of the per-row extraction fix. By scoping all queries to
-    a single row element, we guarantee that extracted fields belong to the same flight.
+    # Elements read per selector within a row (pruned in-page)
+    MAX_PRICE_CANDIDATES = 10
+    MAX_FIELD_CANDIDATES = 5
+
+    # (field, selectors, per-selector element cap) read by the row probe
+    _ROW_FIELDS = (
+        ("price", PRICE_SELECTORS, MAX_PRICE_CANDIDATES),
+        ("emergency_price", EMERGENCY_PRICE_SELECTORS, MAX_FIELD_CANDIDATES),
+        ("airline", AIRLINE_SELECTORS, MAX_FIELD_CANDIDATES),
+        ("stops", STOPS_SELECTORS, MAX_FIELD_CANDIDATES),
+        ("duration", DURATION_SELECTORS, MAX_FIELD_CANDIDATES),
+    )
+    _ROW_PROBE_ARG = _row_probe_arg(_ROW_FIELDS)
+
+    # Runs inside the browser against one row. For each field, queries the
+    # union of its selectors once, then for each selector in priority order
+    # returns up to `limit` matching elements (document order) as
+    # [selector_index, fields] pairs.
+    _ROW_EXTRACT_JS = """
+    (row, fields) => {
+        const record = """ + _ELEMENT_RECORD_JS + """;
+        const result = {};
+        for (const [name, selectors, limit] of fields) {
+            const elements = Array.from(row.querySelectorAll(selectors.join(', ')));
+            const candidates = [];
+            selectors.forEach((selector, index) => {
+                elements.filter(el => el.matches(selector)).slice(0, limit).forEach(el => {
+                    candidates.push([index, record(el)]);
+                });
+            });
+            result[name] = candidates;
+        }
+        return result;
+    }
     """
 
     @classmethod
@@ -894,15 +1377,23 @@ class RowExtractor:
 
         Returns None if no price can be extracted (price is required).
         """
+        # One round-trip reads every field's candidates; the rest is Python
+        candidates = await cls._query_row(row)
+
         # Extract price (required)
-        price_result = await cls._extract_price(row)
+        price_result = (
+            cls._extract_price(candidates["price"])
+            # Emergency fallback: try bare number pattern ONLY on elements
+            # that have price-context indicators (ARIA labels, class names)
+            or cls._extract_price_emergency(candidates["emergency_price"])
+        )
         if not price_result:
             return None
 
         # Extract optional fields
-        airline_result = await cls._extract_airline(row)
-        stops_result = await cls._extract_stops(row)
-        duration_result = await cls._extract_duration(row)
+        airline_result = cls._extract_airline(candidates["airline"])
+        stops_result = cls._extract_stops(candidates["stops"])
+        duration_result = cls._extract_duration(candidates["duration"])
 
         # Determine correlation confidence based on row discovery method
         correlation = cls._correlation_for_level(row_level)
@@ -932,16 +1423,17 @@ class RowExtractor:
 
         flight.calculate_overall_confidence()
 
-        flight.extraction_summary = {
-            "price_strategy": price_result.strategy_name,
-            "price_level": price_result.fallback_level,
-            "airline_extracted": flight.airline is not None,
-            "stops_extracted": flight.stops is not None,
-            "duration_extracted": flight.duration_minutes is not None,
-            "extraction_method": "per_row",
-            "correlation_confidence": correlation,
-            "row_strategy": row_strategy,
-        }
+        if EMIT_EXTRACTION_SUMMARY:
+            flight.extraction_summary = {
+                "price_strategy": price_result.strategy_name,
+                "price_level": price_result.fallback_level,
+                "airline_extracted": flight.airline is not None,
+                "stops_extracted": flight.stops is not None,
+                "duration_extracted": flight.duration_minutes is not None,
+                "extraction_method": "per_row",
+                "correlation_confidence": correlation,
+                "row_strategy": row_strategy,
+            }
 
         return flight
 
@@ -956,240 +1448,153 @@ class RowExtractor:
         }.get(level, 0.70)
 
     @classmethod
-    async def _extract_price(cls, row: ElementHandle) -> Optional[ExtractionResult]:
-        """Extract price from within a row element."""
-        # Try row-scoped price selectors (use standard PRICE_PATTERNS)
-        price_selectors = [
-            ("[data-price]", 0),
-            ("[aria-label*='dollar']", 1),
-            ("[aria-label*='NZD']", 1),
-            ("[aria-label*='price']", 1),
-            ("[class*='price'] span", 2),
-            (".U3gSDe .FpEdX span", 2),  # Known Google Flights price container
-            ("[class*='price']", 2),
-        ]
-
-        for selector, level in price_selectors:
-            try:
-                elements = await row.query_selector_all(selector)
-                for element in elements[:10]:
-                    result = await PriceExtractor._extract_from_element(
-                        element, f"row_{selector}", level
-                    )
-                    if result and result.success:
-                        return result
-            except Exception:
-                continue
-
-        # Emergency fallback: try bare number pattern ONLY on elements
-        # that have price-context indicators (ARIA labels, class names)
-        return await cls._extract_price_emergency(row)
+    async def _query_row(cls, row: ElementHandle) -> Dict[str, _Candidates]:
+        """
+        Read all field candidates from a row in a single evaluate call.
 
-    # Month names used to detect date context around bare numbers
-    _MONTH_PATTERN = re.compile(
-        r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?'
-        r'|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?'
-        r'|Dec(?:ember)?)\b',
-        re.IGNORECASE,
-    )
+        Returns a mapping of field name to (selector, level, fields)
+        candidates in priority order.
+        """
+        raw = await row.evaluate(cls._ROW_EXTRACT_JS, cls._ROW_PROBE_ARG)
+        return {
+            name: [(*selectors[index], fields) for index, fields in raw[name]]
+            for name, selectors, _ in cls._ROW_FIELDS
+        }
 
     @classmethod
-    def _looks_like_year_in_date(cls, number: int, text: str) -> bool:
-        """
-        Return True if `number` appears to be a calendar year inside date text.
+    def _extract_price(cls, candidates: _Candidates) -> Optional[ExtractionResult]:
+        """Extract price from a row's price candidates."""
+        # Row-scoped price selectors use the standard PRICE_PATTERNS
+        for selector, level, fields in candidates:
+            result = PriceExtractor._parse_price_text(
+                PriceExtractor._combined_price_text(fields), f"row_{selector}", level
+            )
+            if result and result.success:
+                return result
 
-        A bare number in the 2020-2035 range is likely a year when the
-        surrounding text contains month names (e.g. "Mar 15, 2026").
-        Legitimate prices at $2026 would have been caught earlier by
-        currency-symbol patterns ($, NZ$, etc.) and never reach the
-        emergency fallback.
-        """
-        if not (2020 <= number <= 2035):
-            return False
-        return bool(cls._MONTH_PATTERN.search(text))
+        return None
 
     @classmethod
-    async def _extract_price_emergency(cls, row: ElementHandle) -> Optional[ExtractionResult]:
+    def _extract_price_emergency(cls, candidates: _Candidates) -> Optional[ExtractionResult]:
         """
         Emergency price extraction using bare number pattern.
 
         Only applied to elements within the row that have price-related
         ARIA labels or class names, to avoid matching flight numbers.
         """
-        price_context_selectors = [
-            "[aria-label*='dollar']", "[aria-label*='price']",
-            "[aria-label*='cost']", "[aria-label*='fare']",
-            "[class*='price']", "[class*='fare']", "[class*='cost']",
-        ]
-
         pattern, pattern_name = PriceExtractor.EMERGENCY_PRICE_PATTERN
 
-        for selector in price_context_selectors:
-            try:
-                elements = await row.query_selector_all(selector)
-                for element in elements[:5]:
-                    text = await element.inner_text() or ""
-                    aria = await element.get_attribute("aria-label") or ""
-                    combined = f"{text} {aria}"
-                    combined_clean = combined.replace(',', '')
-
-                    match = re.search(pattern, combined_clean)
-                    if match:
-                        try:
-                            price = int(match.group(1))
-
-                            # Skip bare numbers that look like years in date text
-                            if cls._looks_like_year_in_date(price, combined):
-                                logger.debug(
-                                    f"Emergency fallback: skipping {price} — "
-                                    f"looks like year in date context: {combined[:80]}"
-                                )
-                                continue
-
-                            validation = PriceValidator.validate(price)
-                            if validation.is_valid:
-                                return ExtractionResult(
-                                    success=True,
-                                    value=price,
-                                    confidence=max(validation.confidence - 0.15, 0.3),
-                                    strategy_name=f"row_emergency_{selector}",
-                                    fallback_level=5,
-                                    raw_text=combined[:100],
-                                    validation=validation,
-                                )
-                        except ValueError:
-                            continue
-            except Exception:
-                continue
+        for selector, level, fields in candidates:
+            combined = f"{fields['text']} {fields['aria']}"
+            combined_clean = combined.replace(',', '')
 
-        return None
+            match = pattern.search(combined_clean)
+            if match:
+                price = int(match.group(1))
 
-    @classmethod
-    async def _extract_airline(cls, row: ElementHandle) -> Optional[ExtractionResult]:
-        """Extract airline from within a row element."""
-        selectors = [
-            ("[data-carrier]", 0),
-            ("[aria-label*='airline']", 0),
-            ("[aria-label*='Operated by']", 0),
-            ("[class*='carrier']", 1),
-            ("[class*='airline']", 1),
-            ("img[alt*='Airways']", 2),
-            ("img[alt*='Airlines']", 2),
-            ("img[alt*='Air']", 2),
-            ("img[alt]", 3),
-        ]
+                # Skip bare numbers that look like years in date text
+                if _looks_like_year_in_date(price, combined):
+                    logger.debug(
+                        f"Emergency fallback: skipping {price} — "
+                        f"looks like year in date context: {combined[:80]}"
+                    )
+                    continue
 
-        for selector, level in selectors:
-            try:
-                elements = await row.query_selector_all(selector)
-                for element in elements[:5]:
-                    text = await element.inner_text() or ""
-                    aria = await element.get_attribute("aria-label") or ""
-                    alt = await element.get_attribute("alt") or ""
-
-                    combined = f"{text} {aria} {alt}".strip()
-                    airline = FlightDetailsExtractor._clean_airline_name(combined)
-
-                    if airline:
-                        validation = AirlineValidator.validate(airline)
-                        if validation.is_valid:
-                            level_penalty = level * 0.05
-                            return ExtractionResult(
-                                success=True,
-                                value=airline,
-                                confidence=max(validation.confidence - level_penalty, 0.1),
-                                strategy_name=f"row_{selector}",
-                                fallback_level=level,
-                                raw_text=combined[:100],
-                                validation=validation,
-                            )
-            except Exception:
-                continue
+                if not PriceValidator.confidence(price):
+                    continue
+
+                validation = PriceValidator.validate(price)
+                if validation.is_valid:
+                    return ExtractionResult(
+                        success=True,
+                        value=price,
+                        confidence=max(validation.confidence - 0.15, 0.3),
+                        strategy_name=f"row_emergency_{selector}",
+                        fallback_level=level,
+                        raw_text=combined[:100],
+                        validation=validation,
+                    )
 
         return None
 
     @classmethod
-    async def _extract_stops(cls, row: ElementHandle) -> Optional[ExtractionResult]:
-        """Extract stops count from within a row element."""
-        selectors = [
-            ("[aria-label*='stop']", 0),
-            ("[aria-label*='Nonstop']", 0),
-            ("[aria-label*='direct']", 0),
-            ("[class*='stop']", 1),
-            ("[data-stops]", 1),
-        ]
+    def _extract_airline(cls, candidates: _Candidates) -> Optional[ExtractionResult]:
+        """Extract airline from a row's airline candidates."""
+
+        for selector, level, fields in candidates:
+            combined = f"{fields['text']} {fields['aria']} {fields['alt']}".strip()
+            airline = FlightDetailsExtractor._clean_airline_name(combined)
+
+            if airline:
+                validation = AirlineValidator.validate(airline)
+                if validation.is_valid:
+                    level_penalty = _LEVEL_PENALTIES[level]
+                    return ExtractionResult(
+                        success=True,
+                        value=airline,
+                        confidence=max(validation.confidence - level_penalty, 0.1),
+                        strategy_name=f"row_{selector}",
+                        fallback_level=level,
+                        raw_text=combined[:100],
+                        validation=validation,
+                    )
 
-        for selector, level in selectors:
-            try:
-                elements = await row.query_selector_all(selector)
-                for element in elements[:5]:
-                    text = await element.inner_text() or ""
-                    aria = await element.get_attribute("aria-label") or ""
-                    combined = f"{text} {aria}".lower()
-
-                    if re.search(r'nonstop|non-stop|direct', combined):
-                        return ExtractionResult(
-                            success=True,
-                            value=0,
-                            confidence=0.95 - level * 0.05,
-                            strategy_name=f"row_{selector}",
-                            fallback_level=level,
-                            raw_text=combined[:50],
-                        )
+        return None
 
-                    match = re.search(r'(\d+)\s*stop', combined)
-                    if match:
-                        stops = int(match.group(1))
-                        validation = StopsValidator.validate(stops)
-                        if validation.is_valid:
-                            return ExtractionResult(
-                                success=True,
-                                value=stops,
-                                confidence=validation.confidence - level * 0.05,
-                                strategy_name=f"row_{selector}",
-                                fallback_level=level,
-                                raw_text=combined[:50],
-                                validation=validation,
-                            )
-            except Exception:
-                continue
+    @classmethod
+    def _extract_stops(cls, candidates: _Candidates) -> Optional[ExtractionResult]:
+        """Extract stops count from a row's stops candidates."""
+
+        for selector, level, fields in candidates:
+            combined = f"{fields['text']} {fields['aria']}"
+
+            if _NONSTOP_RE.search(combined):
+                return ExtractionResult(
+                    success=True,
+                    value=0,
+                    confidence=0.95 - _LEVEL_PENALTIES[level],
+                    strategy_name=f"row_{selector}",
+                    fallback_level=level,
+                    raw_text=combined[:50],
+                )
+
+            match = _STOPS_COUNT_RE.search(combined)
+            if match:
+                stops = int(match.group(1))
+                validation = StopsValidator.validate(stops)
+                if validation.is_valid:
+                    return ExtractionResult(
+                        success=True,
+                        value=stops,
+                        confidence=validation.confidence - _LEVEL_PENALTIES[level],
+                        strategy_name=f"row_{selector}",
+                        fallback_level=level,
+                        raw_text=combined[:50],
+                        validation=validation,
+                    )
 
         return None
 
     @classmethod
-    async def _extract_duration(cls, row: ElementHandle) -> Optional[ExtractionResult]:
-        """Extract flight duration from within a row element."""
-        selectors = [
-            ("[aria-label*='duration']", 0),
-            ("[aria-label*='hr']", 0),
-            ("[aria-label*='hour']", 0),
-            ("[class*='duration']", 1),
-            ("[class*='total-time']", 1),
-        ]
-
-        for selector, level in selectors:
-            try:
-                elements = await row.query_selector_all(selector)
-                for element in elements[:5]:
-                    text = await element.inner_text() or ""
-                    aria = await element.get_attribute("aria-label") or ""
-                    combined = f"{text} {aria}"
-
-                    duration = FlightDetailsExtractor._parse_duration(combined)
-                    if duration:
-                        validation = DurationValidator.validate(duration)
-                        if validation.is_valid:
-                            return ExtractionResult(
-                                success=True,
-                                value=duration,
-                                confidence=validation.confidence - level * 0.05,
-                                strategy_name=f"row_{selector}",
-                                fallback_level=level,
-                                raw_text=combined[:50],
-                                validation=validation,
-                            )
-            except Exception:
-                continue
+    def _extract_duration(cls, candidates: _Candidates) -> Optional[ExtractionResult]:
+        """Extract flight duration from a row's duration candidates."""
+
+        for selector, level, fields in candidates:
+            combined = f"{fields['text']} {fields['aria']}"
+
+            duration = FlightDetailsExtractor._parse_duration(combined)
+            if duration:
+                validation = DurationValidator.validate(duration)
+                if validation.is_valid:
+                    return ExtractionResult(
+                        success=True,
+                        value=duration,
+                        confidence=validation.confidence - _LEVEL_PENALTIES[level],
+                        strategy_name=f"row_{selector}",
+                        fallback_level=level,
+                        raw_text=combined[:50],
+                        validation=validation,
+                    )
 
         return None
 
@@ -1226,34 +1631,38 @@ class RowValidator:
         - 2+ stops with very short duration (<2h)
         - Price suspiciously close to duration (scraper confused the two)
         """
+        price, stops, duration = flight.price, flight.stops, flight.duration_minutes
+
+        # Nothing to cross-check without a duration
+        if duration is None:
+            return 0.0
+
         penalty = 0.0
 
-        if flight.stops is not None and flight.duration_minutes is not None:
+        if stops is not None:
             # Nonstop but extremely long
-            if flight.stops == 0 and flight.duration_minutes > 24 * 60:
+            if stops == 0 and duration > 24 * 60:
                 penalty += 0.15
                 logger.debug(
-                    f"Cross-validation: nonstop flight with {flight.duration_minutes}m "
+                    f"Cross-validation: nonstop flight with {duration}m "
                     f"duration seems too long, applying penalty"
                 )
 
             # Multiple stops but very short
-            if flight.stops >= 2 and flight.duration_minutes < 120:
+            if stops >= 2 and duration < 120:
                 penalty += 0.15
                 logger.debug(
-                    f"Cross-validation: {flight.stops} stops but only "
-                    f"{flight.duration_minutes}m seems too short, applying penalty"
+                    f"Cross-validation: {stops} stops but only "
+                    f"{duration}m seems too short, applying penalty"
                 )
 
         # Price matches duration — almost certainly a misextraction
-        if (flight.price is not None and flight.duration_minutes is not None
-                and flight.duration_minutes > 0):
-            if abs(flight.price - flight.duration_minutes) <= 5:
-                penalty += 0.5
-                logger.debug(
-                    f"Cross-validation: price ${flight.price} matches duration "
-                    f"{flight.duration_minutes}m — likely misextracted"
-                )
+        if price is not None and duration > 0 and abs(price - duration) <= 5:
+            penalty += 0.5
+            logger.debug(
+                f"Cross-validation: price ${price} matches duration "
+                f"{duration}m — likely misextracted"
+            )
 
         return penalty
 
@@ -1262,9 +1671,9 @@ class RowValidator:
 # Unified Extraction Interface
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FlightData:
-    """Extracted flight data with confidence scores."""
+    """Extracted flight data with confidence scores (slotted: one per extracted flight)."""
     price: Optional[int] = None
     price_confidence: float = 0.0
     price_strategy: str = ""
@@ -1285,19 +1694,16 @@ class FlightData:
     extraction_method: str = ""  # "per_row" or "page_level"
 
     overall_confidence: float = 0.0
-    extraction_summary: Dict[str, Any] = field(default_factory=dict)
+    extraction_summary: Optional[Dict[str, Any]] = None  # Set when EMIT_EXTRACTION_SUMMARY
 
     def calculate_overall_confidence(self) -> float:
         """Calculate overall confidence weighting correlation heavily."""
-        field_confidences = [self.price_confidence]
-        if self.airline_confidence > 0:
-            field_confidences.append(self.airline_confidence)
-        if self.stops_confidence > 0:
-            field_confidences.append(self.stops_confidence)
-        if self.duration_confidence > 0:
-            field_confidences.append(self.duration_confidence)
-
-        field_avg = sum(field_confidences) / len(field_confidences)
+        # Average the price confidence with whichever other fields were found
+        found = tuple(
+            c for c in (self.airline_confidence, self.stops_confidence, self.duration_confidence)
+            if c > 0
+        )
+        field_avg = (self.price_confidence + sum(found)) / (1 + len(found))
 
         if self.correlation_confidence > 0:
             # Weight correlation heavily -- correlated data is far more trustworthy
@@ -1309,6 +1715,13 @@ class FlightData:
         return self.overall_confidence
 
 
+def _pad_with_last(results: List[ExtractionResult]) -> Iterator[Optional[ExtractionResult]]:
+    """Yield results, then repeat the last one forever (or None if empty)."""
+    if not results:
+        return itertools.repeat(None)
+    return itertools.chain(results, itertools.repeat(results[-1]))
+
+
 class UnifiedExtractor:
     """
     Unified extraction interface that combines all extractors.
@@ -1317,6 +1730,14 @@ class UnifiedExtractor:
     with graceful degradation - extracts what it can, never fails completely.
     """
 
+    # Max rows extracted concurrently (bounds in-flight CDP calls)
+    ROW_CONCURRENCY = 8
+
+    # Diagnostic: fraction of extractions that also run page-level extraction
+    # alongside per-row and log how the two compare. Sampled, since it
+    # doubles in-browser work for the extractions it applies to.
+    COMPARISON_SAMPLE_RATE = 0.01
+
     @classmethod
     async def extract_all(cls, page: Page) -> List[FlightData]:
         """
@@ -1330,13 +1751,25 @@ class UnifiedExtractor:
 
         Results are deduplicated by (price, stops, duration) to handle
         Google Flights rendering the same flights in multiple DOM sections.
+
+        For a COMPARISON_SAMPLE_RATE fraction of calls, both strategies run
+        concurrently and their results are logged side by side.
         """
-        # Strategy 1: Per-row extraction
-        per_row_flights = await cls._extract_per_row(page)
+        page_level_flights = None
+
+        if random.random() < cls.COMPARISON_SAMPLE_RATE:
+            per_row_flights, page_level_flights = await asyncio.gather(
+                cls._extract_per_row(page), cls._extract_page_level(page)
+            )
+            cls._log_comparison(per_row_flights, page_level_flights)
+        else:
+            # Strategy 1: Per-row extraction
+            per_row_flights = await cls._extract_per_row(page)
 
         # Strategy 2: Page-level fallback (only if per-row found nothing)
         if not per_row_flights:
-            page_level_flights = await cls._extract_page_level(page)
+            if page_level_flights is None:
+                page_level_flights = await cls._extract_page_level(page)
 
             if page_level_flights:
                 logger.warning(
@@ -1354,6 +1787,22 @@ class UnifiedExtractor:
         )
         return cls._deduplicate(per_row_flights)
 
+    @staticmethod
+    def _log_comparison(
+        per_row_flights: List[FlightData],
+        page_level_flights: List[FlightData],
+    ) -> None:
+        """Log per-row vs page-level extraction results for diagnostics."""
+        def best(flights: List[FlightData]) -> str:
+            prices = [f.price for f in flights if f.price is not None]
+            return f"${min(prices)}" if prices else "N/A"
+
+        logger.info(
+            f"Extraction comparison: per-row {len(per_row_flights)} flights "
+            f"(best {best(per_row_flights)}), page-level {len(page_level_flights)} "
+            f"flights (best {best(page_level_flights)})"
+        )
+
     @staticmethod
     def _deduplicate(flights: List[FlightData]) -> List[FlightData]:
         """Remove duplicate flights based on (price, stops, duration).
@@ -1386,26 +1835,35 @@ class UnifiedExtractor:
         if not rows:
             return []
 
-        flights = []
-        for row in rows:
-            try:
-                flight = await RowExtractor.extract_from_row(
+        # Rows are independent, so overlap their browser round-trips
+        semaphore = asyncio.Semaphore(cls.ROW_CONCURRENCY)
+
+        async def extract_row(row: ElementHandle) -> Optional[FlightData]:
+            async with semaphore:
+                return await RowExtractor.extract_from_row(
                     row, strategy_name, strategy_level
                 )
 
-                if flight and RowValidator.validate_row(flight):
-                    # Apply cross-validation penalty
-                    penalty = RowValidator.cross_validate(flight)
-                    if penalty > 0:
-                        flight.overall_confidence = max(
-                            flight.overall_confidence - penalty, 0.1
-                        )
+        results = await asyncio.gather(
+            *(extract_row(row) for row in rows), return_exceptions=True
+        )
 
-                    flights.append(flight)
-            except Exception as e:
-                logger.debug(f"Row extraction failed: {e}")
+        flights = []
+        for flight in results:
+            if isinstance(flight, Exception):
+                logger.debug(f"Row extraction failed: {flight}")
                 continue
 
+            if flight and RowValidator.validate_row(flight):
+                # Apply cross-validation penalty
+                penalty = RowValidator.cross_validate(flight)
+                if penalty > 0:
+                    flight.overall_confidence = max(
+                        flight.overall_confidence - penalty, 0.1
+                    )
+
+                flights.append(flight)
+
         return flights
 
     @classmethod
@@ -1416,38 +1874,51 @@ class UnifiedExtractor:
         Extracts flat lists of prices, airlines, stops, durations and zips
         by index. Low correlation confidence since fields may not correspond.
         """
-        price_results = await PriceExtractor.extract(page)
+        # The four extractors only read the page, so their round-trips can
+        # overlap on the same page. One failing leaves its field unset
+        # rather than losing the others.
+        outcomes = await asyncio.gather(
+            PriceExtractor.extract(page),
+            FlightDetailsExtractor.extract_airline(page),
+            FlightDetailsExtractor.extract_stops(page),
+            FlightDetailsExtractor.extract_duration(page),
+            return_exceptions=True,
+        )
+        for field_name, outcome in zip(("price", "airline", "stops", "duration"), outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Page-level {field_name} extraction failed: {outcome!r}")
+        price_results, airline_results, stops_results, duration_results = (
+            [] if isinstance(outcome, Exception) else outcome for outcome in outcomes
+        )
 
         if not price_results:
             return []
 
-        airline_results = await FlightDetailsExtractor.extract_airline(page)
-        stops_results = await FlightDetailsExtractor.extract_stops(page)
-        duration_results = await FlightDetailsExtractor.extract_duration(page)
-
         flights = []
 
-        for i, price_result in enumerate(price_results):
+        for price_result, airline, stops, duration in zip(
+            price_results,
+            _pad_with_last(airline_results),
+            _pad_with_last(stops_results),
+            _pad_with_last(duration_results),
+        ):
             flight = FlightData(
                 price=price_result.value,
                 price_confidence=price_result.confidence,
                 price_strategy=price_result.strategy_name,
             )
 
-            if airline_results:
-                airline = airline_results[min(i, len(airline_results) - 1)]
+            if airline is not None:
                 flight.airline = airline.value
                 flight.airline_confidence = airline.confidence
                 flight.airline_strategy = airline.strategy_name
 
-            if stops_results:
-                stops = stops_results[min(i, len(stops_results) - 1)]
+            if stops is not None:
                 flight.stops = stops.value
                 flight.stops_confidence = stops.confidence
                 flight.stops_strategy = stops.strategy_name
 
-            if duration_results:
-                duration = duration_results[min(i, len(duration_results) - 1)]
+            if duration is not None:
                 flight.duration_minutes = duration.value
                 flight.duration_confidence = duration.confidence
                 flight.duration_strategy = duration.strategy_name
@@ -1456,15 +1927,16 @@ class UnifiedExtractor:
             flight.correlation_confidence = 0.30 if len(price_results) > 1 else 0.70
             flight.calculate_overall_confidence()
 
-            flight.extraction_summary = {
-                "price_strategy": price_result.strategy_name,
-                "price_level": price_result.fallback_level,
-                "airline_extracted": flight.airline is not None,
-                "stops_extracted": flight.stops is not None,
-                "duration_extracted": flight.duration_minutes is not None,
-                "extraction_method": "page_level",
-                "correlation_confidence": flight.correlation_confidence,
-            }
+            if EMIT_EXTRACTION_SUMMARY:
+                flight.extraction_summary = {
+                    "price_strategy": price_result.strategy_name,
+                    "price_level": price_result.fallback_level,
+                    "airline_extracted": flight.airline is not None,
+                    "stops_extracted": flight.stops is not None,
+                    "duration_extracted": flight.duration_minutes is not None,
+                    "extraction_method": "page_level",
+                    "correlation_confidence": flight.correlation_confidence,
+                }
 
             flights.append(flight)
 
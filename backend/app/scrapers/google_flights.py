@@ -1,15 +1,25 @@
 import asyncio
+import gzip
+import json
 import random
 import os
+import tempfile
+import re
+import time
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from dataclasses import dataclass, field
-from typing import List, Optional, Literal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Literal, Tuple
 from pathlib import Path
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from urllib.parse import urlsplit
+from playwright.async_api import (
+    async_playwright, Playwright, Page, Browser, BrowserContext, Route,
+    TimeoutError as PlaywrightTimeout,
+)
 
 from app.scrapers.extractors import UnifiedExtractor, PriceExtractor
+from app.utils.template_helpers import build_google_flights_url
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +33,12 @@ FailureReason = Literal[
     "no_results",
     "blocked",
     "network_error",
-    "unknown"
+    "unknown",
+    "circuit_open",  # skipped by the route circuit breaker; Google was not contacted
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FlightResult:
     """A single flight option from scraping."""
     price_nzd: Decimal
@@ -39,7 +50,7 @@ class FlightResult:
     raw_data: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     """
     Complete result of a scrape attempt with failure classification.
@@ -52,7 +63,7 @@ class ScrapeResult:
     html_snapshot_path: Optional[str] = None
     error_message: Optional[str] = None
     duration_ms: int = 0
-    scraped_at: datetime = field(default_factory=datetime.utcnow)
+    scraped_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     currency_verified: Optional[bool] = None
     
     @property
@@ -64,6 +75,187 @@ class ScrapeResult:
         return len(self.prices) > 0
 
 
+# Process-wide Playwright driver and Chromium, shared by every scraper
+# instance; each scraper only owns its BrowserContext
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_browser_lock = asyncio.Lock()
+
+# When set (e.g. ws://chromium:9222), connect to an already-running Chromium
+# over CDP instead of launching one, so several workers share one browser
+CHROMIUM_CDP_URL = os.environ.get("CHROMIUM_CDP_URL", "")
+
+
+async def get_browser(launch_args: List[str]) -> Browser:
+    """Launch (or connect to) Chromium on first use and reuse it, reconnecting after a crash.
+
+    launch_args only apply when a browser is actually launched.
+    """
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is not None and not _browser.is_connected():
+            logger.warning("Browser disconnected - relaunching")
+            _browser = None
+
+        if _browser is None:
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            if CHROMIUM_CDP_URL:
+                _browser = await _playwright.chromium.connect_over_cdp(CHROMIUM_CDP_URL)
+            else:
+                _browser = await _playwright.chromium.launch(headless=True, args=launch_args)
+    return _browser
+
+
+async def shutdown_browser():
+    """Close pooled contexts, the shared browser and the driver (on app shutdown).
+
+    A CDP-connected browser is only disconnected from; the remote Chromium keeps running.
+    """
+    global _playwright, _browser
+    await _context_pool.close()
+
+    if _browser is not None:
+        try:
+            await _browser.close()
+        except Exception:
+            pass
+        _browser = None
+
+    if _playwright is not None:
+        try:
+            await _playwright.stop()
+        except Exception:
+            pass
+        _playwright = None
+
+
+class ContextPool:
+    """
+    Bounded pool of warm BrowserContexts in the shared browser.
+
+    acquire() hands out an idle context, or creates one while fewer than
+    max_size exist, otherwise waits for a release(). Contexts keep their
+    cookies between uses; ones whose browser has since crashed are dropped.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: List[BrowserContext] = []
+
+    async def acquire(self, create: Callable[[], Awaitable[BrowserContext]]) -> BrowserContext:
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                context = self._idle.pop()
+                if context.browser is not None and context.browser.is_connected():
+                    return context
+            return await create()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, context: BrowserContext):
+        self._idle.append(context)
+        self._slots.release()
+
+    async def close(self):
+        """Close idle contexts (in-use ones are closed with the browser)."""
+        idle, self._idle = self._idle, []
+        for context in idle:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+
+# Contexts shared by all scrapers; bounds concurrent scrapes process-wide
+MAX_POOLED_CONTEXTS = 3
+_context_pool = ContextPool(MAX_POOLED_CONTEXTS)
+
+
+@dataclass(slots=True)
+class _CircuitState:
+    failures: int = 0  # consecutive pushback failures
+    opens: int = 0  # times opened since the last success
+    reopen_at: float = 0.0  # time.monotonic() when scrapes may resume
+    trial: bool = False  # a half-open trial scrape is in flight
+
+
+class RouteCircuitBreaker:
+    """
+    Per-route breaker for Google pushing back (captcha/blocked/timeout).
+
+    After `failure_threshold` consecutive pushback results for an
+    (origin, destination) pair the route is skipped for a cooldown that
+    doubles with every re-open (with jitter, capped at `max_cooldown_s`).
+    Once the cooldown passes, only the first caller gets a trial scrape;
+    everyone else stays blocked until it is recorded. Success (or any
+    result that isn't pushback) resets the route, another pushback
+    re-opens it straight away. A trial that never reports back (the scrape
+    raised) expires after `trial_timeout_s` and the next caller gets one.
+    Outside a trial, other failure reasons (layout_change, no_results, ...)
+    are not Google's doing and leave the breaker alone.
+    """
+
+    TRIP_REASONS = frozenset({"captcha", "blocked", "timeout"})
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_cooldown_s: float = 300.0,
+        max_cooldown_s: float = 6 * 3600.0,
+        trial_timeout_s: float = 120.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown_s = base_cooldown_s
+        self.max_cooldown_s = max_cooldown_s
+        self.trial_timeout_s = trial_timeout_s
+        self._routes: Dict[Tuple[str, str], _CircuitState] = {}
+
+    def is_open(self, route: Tuple[str, str]) -> bool:
+        """True if the route must be skipped; the first caller after a cooldown gets the trial."""
+        state = self._routes.get(route)
+        if state is None or state.opens == 0:
+            return False
+        now = time.monotonic()
+        if now < state.reopen_at:
+            return True
+        # Half-open: hand the trial to this caller and hold everyone else off
+        state.trial = True
+        state.reopen_at = now + self.trial_timeout_s
+        return False
+
+    def record(self, route: Tuple[str, str], status: str):
+        if status == "success":
+            self._routes.pop(route, None)
+            return
+        state = self._routes.get(route)
+        if status not in self.TRIP_REASONS:
+            if state is not None and state.trial:
+                self._routes.pop(route, None)  # the trial got past Google
+            return
+
+        if state is None:
+            state = self._routes[route] = _CircuitState()
+        state.trial = False
+        state.failures += 1
+        if state.failures >= self.failure_threshold:
+            cooldown = min(self.base_cooldown_s * 2 ** state.opens, self.max_cooldown_s)
+            cooldown *= random.uniform(1.0, 1.2)
+            state.reopen_at = time.monotonic() + cooldown
+            state.opens += 1
+            logger.warning(
+                f"Circuit open for {route[0]}->{route[1]} after {state.failures} "
+                f"consecutive {status} results; pausing {cooldown:.0f}s"
+            )
+
+
+# Shared by all scrapers so every caller backs off the same blocked routes
+_route_breaker = RouteCircuitBreaker()
+
+
 class GoogleFlightsScraper:
     """
     Google Flights scraper with proper failure handling and circuit breaker support.
@@ -71,26 +263,32 @@ class GoogleFlightsScraper:
     Key features (from Oracle review):
     - Failure reason classification
     - Screenshot + HTML capture on failure
-    - Circuit breaker integration
+    - Per-route circuit breaker (see RouteCircuitBreaker)
     - Proper timeout handling
     
-    NOTE: Each scrape creates a fresh browser instance to avoid state leakage
-    and crashes between scrapes. The overhead is acceptable for 2-6 scrapes/day.
+    NOTE: Chromium is launched once per process and shared by all scrapers
+    (see get_browser). Each scrape borrows a warm BrowserContext from a bounded
+    process-wide pool and only opens (and closes) its own page, so cookies and
+    keep-alive connections to Google carry over between routes. A crashed
+    browser is relaunched on the next scrape.
     """
     BASE_URL = "https://www.google.com/travel/flights"
     SCREENSHOTS_DIR = Path("/app/data/screenshots")
     HTML_SNAPSHOTS_DIR = Path("/app/data/html_snapshots")
+    # Cookies/localStorage saved after a successful scrape, so a new context
+    # starts past Google's consent and first-visit setup
+    STORAGE_STATE_PATH = Path("/app/data/browser_state.json")
     
-    # Browser launch arguments for headless operation
+    # Browser launch arguments for headless operation. Chromium runs
+    # multi-process (no --single-process/--no-zygote): those flags put the
+    # renderer, network and GPU work on one thread and slow JS-heavy pages.
+    # Rasterization stays on the CPU (--disable-gpu); the container has no GPU.
     BROWSER_ARGS = [
         "--disable-blink-features=AutomationControlled",
         "--no-sandbox",
         "--disable-dev-shm-usage",
         "--disable-gpu",
-        "--disable-software-rasterizer",
         "--disable-extensions",
-        "--single-process",
-        "--no-zygote",
         "--disable-setuid-sandbox",
         "--disable-accelerated-2d-canvas",
         "--disable-background-networking",
@@ -102,6 +300,39 @@ class GoogleFlightsScraper:
         "--metrics-recording-only",
     ]
     
+    # Navigation only waits for DOMContentLoaded; readiness is then gated on
+    # price selectors appearing (networkidle rarely settles on Google Flights,
+    # whose analytics beacons and price polling keep the network busy)
+    NAVIGATION_TIMEOUT_MS = 15000
+
+    # Concurrent pages for scrape_routes(); more mostly buys memory pressure
+    MAX_PARALLEL_PAGES = 3
+
+    # Options for pooled BrowserContexts. 1280x800 at 1x DPR gets the same
+    # desktop layout as 1080p for about half the raster/compositor work.
+    CONTEXT_OPTIONS = {
+        "viewport": {"width": 1280, "height": 800},
+        "device_scale_factor": 1,
+        "user_agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "locale": "en-US",
+        "timezone_id": "America/New_York",
+        "reduced_motion": "reduce",
+        "color_scheme": "light",
+    }
+
+    # Requests aborted before they hit the network. Stylesheets are kept:
+    # innerText and visibility-based extraction depend on computed styles.
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+    BLOCKED_HOSTS = (
+        "doubleclick.net",
+        "google-analytics.com",
+        "googletagmanager.com",
+    )
+
     # Captcha detection patterns
     CAPTCHA_SELECTORS = [
         "iframe[src*='recaptcha']",
@@ -118,6 +349,42 @@ class GoogleFlightsScraper:
         "access denied",
     ]
     
+    # No-results page wording (vs. a layout change when no prices render)
+    NO_RESULTS_PATTERNS = [
+        "no flights found",
+        "no matching flights",
+        "try different dates",
+        "we couldn't find",
+    ]
+    
+    # Failure screenshots are viewport-only JPEGs; only layout changes need the
+    # whole scrollable page, and a no-results page is fully captured by its HTML
+    FULL_PAGE_SCREENSHOT_REASONS = frozenset({"layout_change"})
+    HTML_ONLY_REASONS = frozenset({"no_results"})
+    SCREENSHOT_JPEG_QUALITY = 60
+    # HTML snapshots are gzipped; level 3 keeps most of the ratio at a fraction of the CPU
+    HTML_GZIP_LEVEL = 3
+
+    # All captcha selectors as one compound selector, and each pattern list as
+    # one alternation matched case-insensitively (no lowercased text copy)
+    _CAPTCHA_SELECTOR = ", ".join(CAPTCHA_SELECTORS)
+    _BLOCKED_PATTERN_SOURCE = "|".join(map(re.escape, BLOCKED_PATTERNS))
+    _NO_RESULTS_PATTERN_SOURCE = "|".join(map(re.escape, NO_RESULTS_PATTERNS))
+
+    # Captcha, block and no-results checks in one in-page probe: the captcha
+    # selector is resolved and the patterns matched against visible text, so
+    # only three booleans cross CDP instead of the serialized HTML
+    _PAGE_STATUS_JS = """
+    ([captchaSelector, blockedSource, noResultsSource]) => {
+        const text = document.body ? document.body.innerText : '';
+        return {
+            captcha: document.querySelector(captchaSelector) !== null,
+            blocked: new RegExp(blockedSource, 'i').test(text),
+            no_results: new RegExp(noResultsSource, 'i').test(text),
+        };
+    }
+    """
+    
     # Price selectors - multiple fallbacks for resilience against layout changes
     PRICE_SELECTORS = [
         "[data-gs]",                           # Primary: data-gs attribute
@@ -128,6 +395,11 @@ class GoogleFlightsScraper:
         "div[class*='price'] span",           # Generic price div
     ]
     
+    # Readiness gate: one wait on the union of the primary price selectors,
+    # which resolves as soon as any of them appears
+    _READY_SELECTOR = ", ".join(PRICE_SELECTORS[:3])
+    READY_TIMEOUT_MS = 15000
+
     # Currency indicators for verification
     CURRENCY_INDICATORS = {
         "NZD": ["NZ$", "NZD", "nz$"],
@@ -137,18 +409,28 @@ class GoogleFlightsScraper:
         "EUR": ["€", "EUR"],
     }
 
-    def __init__(self, screenshots_dir: Optional[Path] = None, html_dir: Optional[Path] = None):
+    # Joins the aria-label and text of the first `limit` price elements
+    # in-page, so sampling them is one round-trip rather than two per element
+    _CURRENCY_SAMPLE_JS = """
+    (elements, limit) => elements.slice(0, limit)
+        .map(el => ` ${el.getAttribute('aria-label') || ''} ${el.innerText}`)
+        .join('')
+    """
+
+    def __init__(
+        self,
+        screenshots_dir: Optional[Path] = None,
+        html_dir: Optional[Path] = None,
+        state_path: Optional[Path] = None,
+    ):
         self.screenshots_dir = screenshots_dir or self.SCREENSHOTS_DIR
         self.html_dir = html_dir or self.HTML_SNAPSHOTS_DIR
+        self.state_path = state_path or self.STORAGE_STATE_PATH
         self.save_debug_snapshots = os.environ.get("SAVE_DEBUG_SNAPSHOTS", "").lower() in ("1", "true", "yes")
 
         # Ensure directories exist
         self.screenshots_dir.mkdir(parents=True, exist_ok=True)
         self.html_dir.mkdir(parents=True, exist_ok=True)
-
-        # Store playwright instance for cleanup (set during scrape)
-        self._playwright = None
-        self._browser = None
     
     def _build_url(
         self,
@@ -167,7 +449,6 @@ class GoogleFlightsScraper:
         checked_bags: int = 0,
     ) -> str:
         """Delegate to centralized URL builder."""
-        from app.utils.template_helpers import build_google_flights_url
         return build_google_flights_url(
             origin=origin,
             destination=destination,
@@ -184,28 +465,77 @@ class GoogleFlightsScraper:
             checked_bags=checked_bags,
         )
     
+    async def _create_context(self) -> BrowserContext:
+        """Create a context in the shared browser for the pool."""
+        browser = await get_browser(self.BROWSER_ARGS)
+        context = await self._new_context(browser)
+        await context.route("**/*", self._filter_request)
+        return context
+
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        """Create a context, restoring the saved storage state when there is one."""
+        if self.state_path.exists():
+            try:
+                return await browser.new_context(
+                    storage_state=str(self.state_path), **self.CONTEXT_OPTIONS
+                )
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable browser state {self.state_path}: {e}")
+        return await browser.new_context(**self.CONTEXT_OPTIONS)
+
+    async def _save_storage_state(self, context: BrowserContext):
+        """Persist cookies/localStorage for the next context (best effort)."""
+        try:
+            state = await context.storage_state()
+            await asyncio.to_thread(self._write_state_file, json.dumps(state))
+        except Exception as e:
+            logger.debug(f"Could not save browser state: {e}")
+
+    def _write_html_snapshot(self, path: Path, content: str):
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=self.HTML_GZIP_LEVEL) as f:
+            f.write(content)
+
+    def _write_state_file(self, content: str):
+        # Write-then-rename so concurrent scrapes never leave a torn file
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, self.state_path)
+
+    @classmethod
+    def _is_blocked_request(cls, resource_type: str, url: str) -> bool:
+        """True for requests the extractors never need (media, trackers)."""
+        if resource_type in cls.BLOCKED_RESOURCE_TYPES:
+            return True
+        host = urlsplit(url).hostname or ""
+        return any(host == h or host.endswith("." + h) for h in cls.BLOCKED_HOSTS)
+
+    async def _filter_request(self, route: Route):
+        request = route.request
+        if self._is_blocked_request(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _random_delay(self, min_sec: float = 2.0, max_sec: float = 5.0):
         await asyncio.sleep(random.uniform(min_sec, max_sec))
     
-    async def _detect_captcha(self, page: Page) -> bool:
-        """Check if page shows a captcha."""
-        for selector in self.CAPTCHA_SELECTORS:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    return True
-            except Exception:
-                continue
-        return False
-    
-    async def _detect_blocked(self, page: Page) -> bool:
-        """Check if we're rate-limited or blocked."""
+    async def _probe_page_status(self, page: Page) -> Dict[str, bool]:
+        """Check for a captcha, a rate-limit/block notice and no-results wording.
+
+        Returns: {"captcha": bool, "blocked": bool, "no_results": bool}
+        """
         try:
-            content = await page.content()
-            content_lower = content.lower()
-            return any(pattern in content_lower for pattern in self.BLOCKED_PATTERNS)
+            return await page.evaluate(
+                self._PAGE_STATUS_JS,
+                [
+                    self._CAPTCHA_SELECTOR,
+                    self._BLOCKED_PATTERN_SOURCE,
+                    self._NO_RESULTS_PATTERN_SOURCE,
+                ],
+            )
         except Exception:
-            return False
+            return {"captcha": False, "blocked": False, "no_results": False}
     
     async def _save_failure_artifacts(
         self,
@@ -218,23 +548,29 @@ class GoogleFlightsScraper:
         
         Returns: (screenshot_path, html_path)
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
         prefix = f"{search_def_id}_{timestamp}_{reason}"
         
         screenshot_path: Optional[str] = None
         html_path: Optional[str] = None
         
-        try:
-            screenshot_file = self.screenshots_dir / f"{prefix}.png"
-            await page.screenshot(path=str(screenshot_file), full_page=True)
-            screenshot_path = str(screenshot_file)
-        except Exception as e:
-            pass  # Don't fail on screenshot failure
+        if reason not in self.HTML_ONLY_REASONS:
+            try:
+                screenshot_file = self.screenshots_dir / f"{prefix}.jpg"
+                await page.screenshot(
+                    path=str(screenshot_file),
+                    type="jpeg",
+                    quality=self.SCREENSHOT_JPEG_QUALITY,
+                    full_page=reason in self.FULL_PAGE_SCREENSHOT_REASONS,
+                )
+                screenshot_path = str(screenshot_file)
+            except Exception as e:
+                pass  # Don't fail on screenshot failure
         
         try:
-            html_file = self.html_dir / f"{prefix}.html"
+            html_file = self.html_dir / f"{prefix}.html.gz"
             content = await page.content()
-            html_file.write_text(content, encoding="utf-8")
+            await asyncio.to_thread(self._write_html_snapshot, html_file, content)
             html_path = str(html_file)
         except Exception as e:
             pass  # Don't fail on HTML save failure
@@ -261,37 +597,72 @@ class GoogleFlightsScraper:
         """
         Scrape Google Flights with proper failure classification.
         
-        Creates a fresh browser instance for each scrape to avoid state leakage
-        and crashes between scrapes (fixes cascading browser context failures).
+        Opens a new page in a pooled browser context; only the page is closed
+        afterwards, the context goes back to the pool for the next scrape.
+        Routes Google keeps blocking are short-circuited as "circuit_open"
+        without touching the browser until their circuit cooldown passes.
         
         Returns ScrapeResult with:
-        - status: success/captcha/timeout/layout_change/no_results/blocked/network_error/unknown
+        - status: success/captcha/timeout/layout_change/no_results/blocked/network_error/unknown/circuit_open
         - prices: List of FlightResult (empty on failure)
         - screenshot_path/html_snapshot_path: Paths to artifacts on failure
         - error_message: Human-readable error description
         """
-        start_time = datetime.utcnow()
-        
-        # Create fresh playwright and browser for this scrape
-        # This avoids browser crashes affecting subsequent scrapes
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=True,
-            args=self.BROWSER_ARGS
-        )
-        
-        context = await self._browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            locale="en-US",
-            timezone_id="America/New_York",
+        route = (origin, destination)
+        if _route_breaker.is_open(route):
+            return ScrapeResult(
+                status="circuit_open",
+                error_message=f"Circuit open for {origin}->{destination} after repeated blocks - skipping",
+            )
+
+        result = await self._scrape_route(
+            search_definition_id=search_definition_id,
+            origin=origin,
+            destination=destination,
+            departure_date=departure_date,
+            return_date=return_date,
+            adults=adults,
+            children=children,
+            infants_in_seat=infants_in_seat,
+            infants_on_lap=infants_on_lap,
+            cabin_class=cabin_class,
+            stops_filter=stops_filter,
+            currency=currency,
+            carry_on_bags=carry_on_bags,
+            checked_bags=checked_bags,
         )
+        _route_breaker.record(route, result.status)
+        return result
+
+    async def _scrape_route(
+        self,
+        search_definition_id: int,
+        origin: str,
+        destination: str,
+        departure_date: date,
+        return_date: Optional[date],
+        adults: int = 2,
+        children: int = 2,
+        infants_in_seat: int = 0,
+        infants_on_lap: int = 0,
+        cabin_class: str = "economy",
+        stops_filter: str = "any",
+        currency: str = "NZD",
+        carry_on_bags: int = 0,
+        checked_bags: int = 0,
+    ) -> ScrapeResult:
+        """Run one scrape in a pooled context (scrape_route minus the circuit breaker)."""
+        start_ns = time.monotonic_ns()  # monotonic: immune to wall-clock jumps
+
+        def elapsed_ms() -> int:
+            return (time.monotonic_ns() - start_ns) // 1_000_000
         
-        page = await context.new_page()
+        context = await _context_pool.acquire(self._create_context)
+        try:
+            page = await context.new_page()
+        except Exception:
+            _context_pool.release(context)
+            raise
         results: List[FlightResult] = []
         
         try:
@@ -306,23 +677,29 @@ class GoogleFlightsScraper:
             
             # Navigate with timeout
             try:
-                await page.goto(url, wait_until="networkidle", timeout=30000)
+                await page.goto(
+                    url, wait_until="domcontentloaded", timeout=self.NAVIGATION_TIMEOUT_MS
+                )
             except PlaywrightTimeout:
                 screenshot_path, html_path = await self._save_failure_artifacts(
                     page, search_definition_id, "timeout"
                 )
                 return ScrapeResult(
                     status="timeout",
-                    error_message="Page load timed out after 30 seconds",
+                    error_message=(
+                        f"Page load timed out after {self.NAVIGATION_TIMEOUT_MS // 1000} seconds"
+                    ),
                     screenshot_path=screenshot_path,
                     html_snapshot_path=html_path,
-                    duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                    duration_ms=elapsed_ms()
                 )
             
-            await self._random_delay(3, 6)
+            await self._random_delay(0.5, 1.5)
             
+            status = await self._probe_page_status(page)
+
             # Check for captcha
-            if await self._detect_captcha(page):
+            if status["captcha"]:
                 screenshot_path, html_path = await self._save_failure_artifacts(
                     page, search_definition_id, "captcha"
                 )
@@ -331,11 +708,11 @@ class GoogleFlightsScraper:
                     error_message="Captcha detected - manual intervention may be required",
                     screenshot_path=screenshot_path,
                     html_snapshot_path=html_path,
-                    duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                    duration_ms=elapsed_ms()
                 )
             
             # Check for blocked/rate-limited
-            if await self._detect_blocked(page):
+            if status["blocked"]:
                 screenshot_path, html_path = await self._save_failure_artifacts(
                     page, search_definition_id, "blocked"
                 )
@@ -344,34 +721,25 @@ class GoogleFlightsScraper:
                     error_message="Detected rate limiting or block from Google",
                     screenshot_path=screenshot_path,
                     html_snapshot_path=html_path,
-                    duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                    duration_ms=elapsed_ms()
                 )
             
-            # Wait for page to have content - try primary selectors first
+            # Wait for page to have content: whichever primary selector shows first
             page_ready = False
-            for selector in self.PRICE_SELECTORS[:3]:  # Try top 3 selectors
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    page_ready = True
-                    break
-                except PlaywrightTimeout:
-                    continue
+            try:
+                await page.wait_for_selector(self._READY_SELECTOR, timeout=self.READY_TIMEOUT_MS)
+                page_ready = True
+            except PlaywrightTimeout:
+                pass
 
             if not page_ready:
                 # Check if it's a no-results page vs layout change
-                no_flights_indicators = [
-                    "no flights found",
-                    "no matching flights",
-                    "try different dates",
-                    "we couldn't find",
-                ]
-                content = (await page.content()).lower()
-
-                if any(indicator in content for indicator in no_flights_indicators):
+                status = await self._probe_page_status(page)
+                if status["no_results"]:
                     return ScrapeResult(
                         status="no_results",
                         error_message="No flights found for this route/date combination",
-                        duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                        duration_ms=elapsed_ms()
                     )
 
             # Use the unified extractor with 20+ fallback strategies
@@ -388,7 +756,7 @@ class GoogleFlightsScraper:
                     error_message="No prices extracted using 20+ fallback strategies - Google may have changed page structure",
                     screenshot_path=screenshot_path,
                     html_snapshot_path=html_path,
-                    duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                    duration_ms=elapsed_ms()
                 )
 
             # Convert extracted flights to FlightResult objects
@@ -408,6 +776,7 @@ class GoogleFlightsScraper:
                         "stops_confidence": flight.stops_confidence,
                         "duration_confidence": flight.duration_confidence,
                         "overall_confidence": flight.overall_confidence,
+                        "extraction_method": flight.extraction_method,
                         "extraction_summary": flight.extraction_summary,
                     }
                 ))
@@ -426,7 +795,7 @@ class GoogleFlightsScraper:
                     error_message="Price elements found but could not parse any valid prices",
                     screenshot_path=screenshot_path,
                     html_snapshot_path=html_path,
-                    duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                    duration_ms=elapsed_ms()
                 )
             
             # Verify currency matches what was requested
@@ -435,11 +804,13 @@ class GoogleFlightsScraper:
             # Save debug snapshot if enabled
             await self._save_debug_snapshot(page, search_definition_id)
 
+            await self._save_storage_state(context)
+
             # Success!
             return ScrapeResult(
                 status="success",
                 prices=results,
-                duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000),
+                duration_ms=elapsed_ms(),
                 currency_verified=currency_ok,
             )
             
@@ -453,18 +824,48 @@ class GoogleFlightsScraper:
                 error_message=f"Unexpected error: {str(e)}",
                 screenshot_path=screenshot_path,
                 html_snapshot_path=html_path,
-                duration_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                duration_ms=elapsed_ms()
             )
         
         finally:
-            # Always close context, browser, and playwright to avoid resource leaks
+            # Only the page is per-scrape; the context is reused by the next route
             try:
-                await context.close()
+                await page.close()
             except Exception:
                 pass
-            
-            await self._cleanup_browser()
+            _context_pool.release(context)
     
+    async def scrape_routes(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_parallel: int = MAX_PARALLEL_PAGES,
+    ) -> List[ScrapeResult]:
+        """
+        Scrape several routes concurrently in pooled browser contexts.
+
+        Each job is a dict of scrape_route keyword arguments. At most
+        `max_parallel` pages are open at once (and no more than the context
+        pool allows process-wide). Results are returned in job
+        order; a job that raises becomes an "unknown" ScrapeResult.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+        return await asyncio.gather(
+            *(self._scrape_one_guarded(semaphore, job) for job in jobs)
+        )
+
+    async def _scrape_one_guarded(
+        self, semaphore: asyncio.Semaphore, job: Dict[str, Any]
+    ) -> ScrapeResult:
+        async with semaphore:
+            try:
+                return await self.scrape_route(**job)
+            except Exception as e:
+                logger.error(f"Scrape failed for {job.get('origin')}->{job.get('destination')}: {e}")
+                return ScrapeResult(
+                    status="unknown",
+                    error_message=f"Scraper exception: {str(e)}"
+                )
+
     async def _verify_currency(self, page: Page, expected_currency: str) -> bool:
         """Check if rendered prices match the expected currency."""
         indicators = self.CURRENCY_INDICATORS.get(expected_currency.upper(), [])
@@ -473,12 +874,11 @@ class GoogleFlightsScraper:
 
         try:
             # Check ARIA labels and price text for currency indicators
-            price_elements = await page.query_selector_all("[aria-label*='dollar'], [aria-label*='price'], [data-gs]")
-            sampled_text = ""
-            for el in price_elements[:10]:
-                aria = await el.get_attribute("aria-label") or ""
-                inner = await el.inner_text()
-                sampled_text += f" {aria} {inner}"
+            sampled_text = await page.eval_on_selector_all(
+                "[aria-label*='dollar'], [aria-label*='price'], [data-gs]",
+                self._CURRENCY_SAMPLE_JS,
+                10,
+            )
 
             if not sampled_text.strip():
                 logger.warning(f"Currency verification: no price text found to verify")
@@ -513,34 +913,21 @@ class GoogleFlightsScraper:
         if not self.save_debug_snapshots:
             return None
         try:
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            html_file = self.html_dir / f"{search_def_id}_{timestamp}_success.html"
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+            html_file = self.html_dir / f"{search_def_id}_{timestamp}_success.html.gz"
             content = await page.content()
-            html_file.write_text(content, encoding="utf-8")
+            await asyncio.to_thread(self._write_html_snapshot, html_file, content)
             logger.debug(f"Saved debug snapshot: {html_file}")
             return str(html_file)
         except Exception:
             return None
 
-    async def _cleanup_browser(self):
-        """Clean up browser and playwright instances."""
-        if self._browser:
-            try:
-                await self._browser.close()
-            except Exception:
-                pass
-            self._browser = None
-        
-        if self._playwright:
-            try:
-                await self._playwright.stop()
-            except Exception:
-                pass
-            self._playwright = None
-    
     async def close(self):
-        """Clean up resources. Called for backward compatibility."""
-        await self._cleanup_browser()
+        """Release scraper resources. Safe to call more than once.
+
+        Contexts are pooled and the browser is shared, so there is nothing
+        per-instance to close; shutdown_browser() releases both on app shutdown.
+        """
 
 
 class ScraperError(Exception):
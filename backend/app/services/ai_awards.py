@@ -8,18 +8,9 @@ import json
 import logging
 from typing import Optional
 
-logger = logging.getLogger(__name__)
-
+from app.services.ai_service import parse_json_response
 
-def _parse_json_response(response: str) -> dict:
-    """Extract JSON from an AI response, handling markdown code fences."""
-    text = response.strip()
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"):
-            text = text[4:]
-    text = text.strip()
-    return json.loads(text)
+logger = logging.getLogger(__name__)
 
 
 def _build_observation_summary(search, observations) -> str:
@@ -56,21 +47,20 @@ def _build_observation_summary(search, observations) -> str:
     if observations:
         parts.append(f"\nObservation history ({len(observations)} data points):")
         for obs in observations:
-            obs_parts = []
-            obs_parts.append(f"  Date: {obs.observed_at.strftime('%Y-%m-%d %H:%M')}")
-            obs_parts.append(f"    Total options: {obs.total_options}")
+            observed_at = obs.observed_at.strftime("%Y-%m-%d %H:%M")
+            parts.append(f"  Date: {observed_at}")
+            parts.append(f"    Total options: {obs.total_options}")
             if obs.programs_with_availability:
-                obs_parts.append(f"    Programs available: {', '.join(obs.programs_with_availability)}")
+                parts.append(f"    Programs available: {', '.join(obs.programs_with_availability)}")
             if obs.best_economy_miles:
-                obs_parts.append(f"    Best economy: {obs.best_economy_miles:,} miles")
+                parts.append(f"    Best economy: {obs.best_economy_miles:,} miles")
             if obs.best_business_miles:
-                obs_parts.append(f"    Best business: {obs.best_business_miles:,} miles")
+                parts.append(f"    Best business: {obs.best_business_miles:,} miles")
             if obs.best_first_miles:
-                obs_parts.append(f"    Best first: {obs.best_first_miles:,} miles")
+                parts.append(f"    Best first: {obs.best_first_miles:,} miles")
             if obs.max_seats_available:
-                obs_parts.append(f"    Max seats: {obs.max_seats_available}")
-            obs_parts.append(f"    Changed from previous: {'yes' if obs.is_changed else 'no'}")
-            parts.append("\n".join(obs_parts))
+                parts.append(f"    Max seats: {obs.max_seats_available}")
+            parts.append(f"    Changed from previous: {'yes' if obs.is_changed else 'no'}")
     else:
         parts.append("\nNo observation history available yet.")
 
@@ -170,7 +160,7 @@ async def find_patterns(search, observations, db=None) -> dict:
     )
 
     try:
-        result = _parse_json_response(response)
+        result = parse_json_response(response)
         return {
             "sweet_spots": result.get("sweet_spots", []),
             "timing": result.get("timing", ""),
@@ -240,7 +230,7 @@ async def evaluate_miles(
     )
 
     try:
-        result = _parse_json_response(response)
+        result = parse_json_response(response)
         return {
             "cents_per_mile": result.get("cents_per_mile", 0),
             "rating": result.get("rating", "fair"),
@@ -4,52 +4,45 @@ Provides deal digest summaries, deal explanations, and settings optimization
 using the configured AI provider.
 """
 
+import asyncio
 import json
 import logging
 from typing import Optional
 
-logger = logging.getLogger(__name__)
-
+from app.services.ai_service import AIService, parse_json_response
 
-def _parse_json_response(response: str) -> dict:
-    """Extract JSON from an AI response, handling markdown code fences."""
-    text = response.strip()
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"):
-            text = text[4:]
-    text = text.strip()
-    return json.loads(text)
+logger = logging.getLogger(__name__)
 
 
 def _build_deals_summary(deals) -> str:
     """Build a human-readable summary of deals for AI prompts."""
-    parts = []
+    return "\n".join(_iter_deal_lines(deals))
+
+
+def _iter_deal_lines(deals):
+    """Yield one summary line per deal, each joined once from its segments."""
     for i, deal in enumerate(deals, 1):
-        line = f"{i}. "
         if deal.parsed_origin and deal.parsed_destination:
-            line += f"{deal.parsed_origin} -> {deal.parsed_destination}"
+            segments = [f"{i}. {deal.parsed_origin} -> {deal.parsed_destination}"]
         else:
-            line += deal.raw_title[:80]
+            segments = [f"{i}. {deal.raw_title[:80]}"]
 
         if deal.parsed_price and deal.parsed_currency:
-            line += f" | {deal.parsed_currency} {deal.parsed_price}"
+            segments.append(f" | {deal.parsed_currency} {deal.parsed_price}")
 
         if deal.parsed_airline:
-            line += f" | {deal.parsed_airline}"
+            segments.append(f" | {deal.parsed_airline}")
 
         if deal.parsed_cabin_class:
-            line += f" | {deal.parsed_cabin_class}"
+            segments.append(f" | {deal.parsed_cabin_class}")
 
         if deal.deal_rating is not None:
-            line += f" | {deal.deal_rating:.0f}% below market"
+            segments.append(f" | {deal.deal_rating:.0f}% below market")
 
         if deal.rating_label:
-            line += f" ({deal.rating_label})"
+            segments.append(f" ({deal.rating_label})")
 
-        parts.append(line)
-
-    return "\n".join(parts)
+        yield "".join(segments)
 
 
 def _build_deal_detail(deal) -> str:
@@ -195,6 +188,27 @@ Return ONLY valid JSON:
 {"assessment": "1-2 sentence overall assessment.", "suggestions": [{"title": "Suggestion title", "description": "Why and how this helps"}], "score": 1-10}"""
 
 
+def _digest_prompt(deals) -> tuple[str, dict]:
+    """Build the deal digest prompt and its token/cost estimate."""
+    deals_summary = _build_deals_summary(deals)
+    prompt = f"Summarize these recent flight deals into a morning briefing:\n\n{deals_summary}"
+    return prompt, AIService.estimate_tokens(prompt, DEAL_DIGEST_SYSTEM, max_tokens=300)
+
+
+def _explain_prompt(deal) -> tuple[str, dict]:
+    """Build the deal explanation prompt and its token/cost estimate."""
+    deal_detail = _build_deal_detail(deal)
+    prompt = f"Explain why this flight deal is notable:\n\n{deal_detail}"
+    return prompt, AIService.estimate_tokens(prompt, DEAL_EXPLAIN_SYSTEM, max_tokens=300)
+
+
+def _settings_prompt(settings) -> tuple[str, dict]:
+    """Build the settings review prompt and its token/cost estimate."""
+    settings_summary = _build_settings_summary(settings)
+    prompt = f"Review this flight deal monitoring configuration and suggest improvements:\n\n{settings_summary}"
+    return prompt, AIService.estimate_tokens(prompt, SETTINGS_REVIEW_SYSTEM, max_tokens=500)
+
+
 async def generate_digest(deals, db=None) -> dict:
     """Generate an AI-powered digest summary of recent deals.
 
@@ -205,12 +219,7 @@ async def generate_digest(deals, db=None) -> dict:
     Returns:
         Dict with "summary", "highlights", and "estimate" keys.
     """
-    from app.services.ai_service import AIService
-
-    deals_summary = _build_deals_summary(deals)
-    prompt = f"Summarize these recent flight deals into a morning briefing:\n\n{deals_summary}"
-
-    estimate = AIService.estimate_tokens(prompt, DEAL_DIGEST_SYSTEM, max_tokens=300)
+    prompt, estimate = _digest_prompt(deals)
 
     response = await AIService.complete(
         prompt=prompt,
@@ -221,7 +230,7 @@ async def generate_digest(deals, db=None) -> dict:
     )
 
     try:
-        result = _parse_json_response(response)
+        result = parse_json_response(response)
         return {
             "summary": result.get("summary", "No summary available."),
             "highlights": result.get("highlights", []),
@@ -246,12 +255,7 @@ async def explain_deal(deal, db=None) -> dict:
     Returns:
         Dict with "explanation", "verdict", and "estimate" keys.
     """
-    from app.services.ai_service import AIService
-
-    deal_detail = _build_deal_detail(deal)
-    prompt = f"Explain why this flight deal is notable:\n\n{deal_detail}"
-
-    estimate = AIService.estimate_tokens(prompt, DEAL_EXPLAIN_SYSTEM, max_tokens=300)
+    prompt, estimate = _explain_prompt(deal)
 
     response = await AIService.complete(
         prompt=prompt,
@@ -262,7 +266,7 @@ async def explain_deal(deal, db=None) -> dict:
     )
 
     try:
-        result = _parse_json_response(response)
+        result = parse_json_response(response)
         return {
             "explanation": result.get("explanation", "Unable to assess this deal."),
             "verdict": result.get("verdict", "not_sure"),
@@ -287,12 +291,7 @@ async def review_settings(settings, db=None) -> dict:
     Returns:
         Dict with "assessment", "suggestions", "score", and "estimate" keys.
     """
-    from app.services.ai_service import AIService
-
-    settings_summary = _build_settings_summary(settings)
-    prompt = f"Review this flight deal monitoring configuration and suggest improvements:\n\n{settings_summary}"
-
-    estimate = AIService.estimate_tokens(prompt, SETTINGS_REVIEW_SYSTEM, max_tokens=500)
+    prompt, estimate = _settings_prompt(settings)
 
     response = await AIService.complete(
         prompt=prompt,
@@ -303,7 +302,7 @@ async def review_settings(settings, db=None) -> dict:
     )
 
     try:
-        result = _parse_json_response(response)
+        result = parse_json_response(response)
         return {
             "assessment": result.get("assessment", "Unable to assess configuration."),
             "suggestions": result.get("suggestions", []),
@@ -320,28 +319,67 @@ async def review_settings(settings, db=None) -> dict:
         }
 
 
+# AI calls the bulk helpers keep in flight at once, to stay inside provider rate limits
+BULK_CONCURRENCY = 4
+
+
+async def generate_digests_bulk(deal_batches, db=None, concurrency: int = BULK_CONCURRENCY) -> list:
+    """Generate a digest for each batch of deals, running the AI calls concurrently.
+
+    Args:
+        deal_batches: List of deal lists, one digest per list.
+        db: Optional database session for usage logging.
+        concurrency: Maximum number of AI calls in flight at once.
+
+    Returns:
+        List of generate_digest() dicts in batch order. A batch whose call
+        raises gets an empty digest with an "error" key instead.
+    """
+    fallback = {"summary": "", "highlights": [], "estimate": None}
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(_run_guarded(semaphore, generate_digest, deals, db, fallback) for deals in deal_batches)
+    )
+
+
+async def explain_deals_bulk(deals, db=None, concurrency: int = BULK_CONCURRENCY) -> list:
+    """Explain several deals, running the AI calls concurrently.
+
+    Args:
+        deals: List of Deal model instances.
+        db: Optional database session for usage logging.
+        concurrency: Maximum number of AI calls in flight at once.
+
+    Returns:
+        List of explain_deal() dicts in deal order. A deal whose call raises
+        gets an empty explanation with an "error" key instead.
+    """
+    fallback = {"explanation": "", "verdict": "not_sure", "estimate": None}
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(_run_guarded(semaphore, explain_deal, deal, db, fallback) for deal in deals)
+    )
+
+
+async def _run_guarded(semaphore: asyncio.Semaphore, func, item, db, fallback: dict) -> dict:
+    async with semaphore:
+        try:
+            return await func(item, db=db)
+        except Exception as e:
+            logger.warning(f"{func.__name__} failed in bulk run: {e}")
+            return {**fallback, "error": str(e)}
+
+
 def estimate_digest(deals) -> dict:
     """Return a token/cost estimate for a deal digest without running the AI."""
-    from app.services.ai_service import AIService
-
-    deals_summary = _build_deals_summary(deals)
-    prompt = f"Summarize these recent flight deals into a morning briefing:\n\n{deals_summary}"
-    return AIService.estimate_tokens(prompt, DEAL_DIGEST_SYSTEM, max_tokens=300)
+    return _digest_prompt(deals)[1]
 
 
 def estimate_explain(deal) -> dict:
     """Return a token/cost estimate for a deal explanation without running the AI."""
-    from app.services.ai_service import AIService
-
-    deal_detail = _build_deal_detail(deal)
-    prompt = f"Explain why this flight deal is notable:\n\n{deal_detail}"
-    return AIService.estimate_tokens(prompt, DEAL_EXPLAIN_SYSTEM, max_tokens=300)
+    return _explain_prompt(deal)[1]
 
 
 def estimate_settings_review(settings) -> dict:
     """Return a token/cost estimate for a settings review without running the AI."""
-    from app.services.ai_service import AIService
-
-    settings_summary = _build_settings_summary(settings)
-    prompt = f"Review this flight deal monitoring configuration and suggest improvements:\n\n{settings_summary}"
-    return AIService.estimate_tokens(prompt, SETTINGS_REVIEW_SYSTEM, max_tokens=500)
+    return _settings_prompt(settings)[1]
@@ -1,6 +1,7 @@
 import json
 import hashlib
 import logging
+import re
 import time
 import httpx
 from abc import ABC, abstractmethod
@@ -41,6 +42,30 @@ PROVIDER_DEFAULT_RATES: Dict[str, Dict[str, float]] = {
 }
 
 
+# Leading markdown fence (optionally tagged "json"); anything after the
+# closing fence is ignored, and an unterminated fence runs to the end.
+_FENCE_RE = re.compile(r"\s*```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.S)
+
+
+def parse_json_response(response: str) -> dict:
+    """Extract JSON from an AI response, handling markdown code fences and a stray trailing comma."""
+    try:
+        return json.loads(response)  # clean JSON (the usual case) needs no surgery
+    except json.JSONDecodeError:
+        pass
+
+    match = _FENCE_RE.match(response)
+    text = match.group(1) if match else response.strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        # Models occasionally trail the object with a stray comma
+        trimmed = text.rstrip(",\n ")
+        if trimmed == text:
+            raise
+        return json.loads(trimmed)
+
+
 @dataclass
 class ParsedDealResult:
     origin: Optional[str] = None
@@ -234,6 +259,7 @@ class AIService:
     _model: Optional[str] = None
     _cache: Dict[str, CacheEntry] = {}
     _cache_ttl: float = 3600.0  # 1 hour default
+    _cache_max_entries: int = 512  # least recently used entries are evicted past this
 
     @classmethod
     def configure(
@@ -291,11 +317,16 @@ class AIService:
         if (time.time() - entry.timestamp) > cls._cache_ttl:
             del cls._cache[cache_key]
             return None
+        # Re-insert so dict order tracks recency for eviction
+        cls._cache[cache_key] = cls._cache.pop(cache_key)
         return entry.response
 
     @classmethod
     def _set_cached(cls, cache_key: str, response: str) -> None:
-        """Store a response in the cache."""
+        """Store a response in the cache, evicting the least recently used entries when full."""
+        cls._cache.pop(cache_key, None)
+        while len(cls._cache) >= cls._cache_max_entries:
+            del cls._cache[next(iter(cls._cache))]
         cls._cache[cache_key] = CacheEntry(response=response, timestamp=time.time())
 
     @classmethod
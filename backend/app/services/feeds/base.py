@@ -19,6 +19,8 @@ VALID_AIRPORT_CODES = set(AIRPORTS.keys())
 MAX_RETRIES = 3
 RETRY_DELAY = 2.0
 
+NON_DIGIT_PATTERN = re.compile(r'\D+')
+
 
 @dataclass
 class ParseResult:
@@ -279,20 +281,18 @@ class BaseFeedParser(ABC):
     
     def _extract_price(self, text: str) -> Optional[tuple[int, str]]:
         match = self.PRICE_PATTERN.search(text)
-        if match:
-            price_str = match.group(1).replace(',', '').replace('.', '')
-            try:
-                price = int(price_str)
-                currency = "USD"
-                if '€' in text or 'EUR' in text.upper():
-                    currency = "EUR"
-                elif '£' in text or 'GBP' in text.upper():
-                    currency = "GBP"
-                elif 'NZD' in text.upper():
-                    currency = "NZD"
-                elif 'AUD' in text.upper():
-                    currency = "AUD"
-                return (price, currency)
-            except ValueError:
-                pass
-        return None
+        if not match:
+            return None
+        # The captured group is digits with at most one thousands separator
+        price = int(NON_DIGIT_PATTERN.sub('', match.group(1)))
+        upper = text.upper()
+        currency = "USD"
+        if '€' in text or 'EUR' in upper:
+            currency = "EUR"
+        elif '£' in text or 'GBP' in upper:
+            currency = "GBP"
+        elif 'NZD' in upper:
+            currency = "NZD"
+        elif 'AUD' in upper:
+            currency = "AUD"
+        return (price, currency)
@@ -59,6 +59,8 @@ class FetchResult:
     fallback_used: bool = False
     attempts: int = 1
     price_insights: Optional[dict] = None
+    # The source chose not to run (e.g. route circuit open); not an error
+    skipped: bool = False
 
 
 class PriceSource(ABC):
@@ -124,7 +126,7 @@ class PriceSource(ABC):
             )
             result.attempts = attempt + 1
             
-            if result.success:
+            if result.success or result.skipped:
                 return result
             
             last_error = result.error
@@ -541,6 +543,10 @@ class PlaywrightSource(PriceSource):
                     for p in result.prices
                 ]
                 return FetchResult(success=True, prices=prices, source=self.name)
+
+            if result.status == "circuit_open":
+                logger.info(f"{self.name}: {result.error_message}")
+                return FetchResult(success=False, source=self.name, skipped=True)
             
             return FetchResult(
                 success=False,
@@ -680,6 +686,10 @@ class FlightPriceFetcher:
             )
             total_attempts += result.attempts
             
+            if result.skipped:
+                logger.info(f"Skipping {source.name} - source declined this route")
+                continue
+
             if result.success:
                 result.fallback_used = (i > 0)
                 result.attempts = total_attempts
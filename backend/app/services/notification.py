@@ -8,12 +8,13 @@ Supports:
 - discord: Discord webhook
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict
 import uuid
 import logging
 import json
+import operator
 import httpx
 
 from app.config import get_settings
@@ -35,6 +36,17 @@ class Notification:
     sent: bool = False
     provider: str = "none"
 
+    def to_dict(self) -> Dict:
+        """Shallow dict of the fields (tags copied); cheaper than asdict()."""
+        d = dict(zip(_NOTIFICATION_FIELDS, _notification_values(self)))
+        d["tags"] = list(self.tags)
+        return d
+
+
+# Field order and getter fixed once, rather than introspected per to_dict()
+_NOTIFICATION_FIELDS = tuple(f.name for f in fields(Notification))
+_notification_values = operator.attrgetter(*_NOTIFICATION_FIELDS)
+
 
 class NotificationHistory:
     """In-memory notification history for dashboard display."""
@@ -50,7 +62,7 @@ class NotificationHistory:
 
     def get_recent(self, limit: int = 50) -> List[Dict]:
         recent = self._notifications[-limit:] if limit else self._notifications
-        return [asdict(n) for n in reversed(recent)]
+        return [n.to_dict() for n in reversed(recent)]
 
     def clear(self):
         self._notifications.clear()
@@ -98,8 +98,11 @@ class ScrapingService:
                 error_message=f"Scraper exception: {str(e)}"
             )
         
-        # Update health tracking
-        if result.is_success:
+        # Update health tracking (a scrape skipped by the scraper's route
+        # breaker never reached Google, so it says nothing about health)
+        if result.status == "circuit_open":
+            logger.warning(f"Scrape skipped: {search_def.display_name} - {result.error_message}")
+        elif result.is_success:
             health.record_success()
             logger.info(f"Scrape success: {search_def.display_name} - {len(result.prices)} prices")
         else:
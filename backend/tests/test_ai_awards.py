@@ -22,8 +22,8 @@ from app.services.ai_awards import (
     estimate_mile_value,
     _build_observation_summary,
     _build_mile_value_context,
-    _parse_json_response,
 )
+from app.services.ai_service import parse_json_response
 
 
 def make_search(**overrides):
@@ -137,20 +137,28 @@ class TestBuildMileValueContext:
 
 class TestParseJsonResponse:
     def test_plain_json(self):
-        result = _parse_json_response('{"rating": "good"}')
+        result = parse_json_response('{"rating": "good"}')
         assert result["rating"] == "good"
 
     def test_json_with_code_fence(self):
-        result = _parse_json_response('```json\n{"rating": "good"}\n```')
+        result = parse_json_response('```json\n{"rating": "good"}\n```')
         assert result["rating"] == "good"
 
     def test_json_with_generic_fence(self):
-        result = _parse_json_response('```\n{"rating": "good"}\n```')
+        result = parse_json_response('```\n{"rating": "good"}\n```')
         assert result["rating"] == "good"
 
     def test_invalid_json_raises(self):
         with pytest.raises(json.JSONDecodeError):
-            _parse_json_response("This is not JSON at all")
+            parse_json_response("This is not JSON at all")
+
+    def test_text_after_closing_fence_ignored(self):
+        result = parse_json_response('```json\n{"rating": "good"}\n```\nHope this helps!')
+        assert result["rating"] == "good"
+
+    def test_trailing_comma_tolerated(self):
+        result = parse_json_response('{"rating": "good"},\n')
+        assert result["rating"] == "good"
 
 
 class TestFindPatterns:
@@ -4,6 +4,7 @@ Tests prompt construction and response parsing by mocking AIService.complete.
 Run with: python3 -m pytest backend/tests/test_ai_deals.py -v --noconftest
 """
 
+import asyncio
 import json
 import sys
 import os
@@ -22,11 +23,13 @@ from app.services.ai_deals import (
     estimate_digest,
     estimate_explain,
     estimate_settings_review,
+    generate_digests_bulk,
+    explain_deals_bulk,
     _build_deals_summary,
     _build_deal_detail,
     _build_settings_summary,
-    _parse_json_response,
 )
+from app.services.ai_service import parse_json_response
 
 
 def make_deal(**overrides):
@@ -76,20 +79,24 @@ def make_settings(**overrides):
 
 class TestParseJsonResponse:
     def test_plain_json(self):
-        result = _parse_json_response('{"summary": "Great deals today"}')
+        result = parse_json_response('{"summary": "Great deals today"}')
         assert result["summary"] == "Great deals today"
 
     def test_json_with_code_fence(self):
-        result = _parse_json_response('```json\n{"summary": "Great deals"}\n```')
+        result = parse_json_response('```json\n{"summary": "Great deals"}\n```')
         assert result["summary"] == "Great deals"
 
     def test_json_with_generic_fence(self):
-        result = _parse_json_response('```\n{"summary": "Great deals"}\n```')
+        result = parse_json_response('```\n{"summary": "Great deals"}\n```')
         assert result["summary"] == "Great deals"
 
     def test_invalid_json_raises(self):
         with pytest.raises(json.JSONDecodeError):
-            _parse_json_response("This is not JSON")
+            parse_json_response("This is not JSON")
+
+    def test_text_after_closing_fence_ignored(self):
+        result = parse_json_response('```json\n{"summary": "Great deals"}\n```\nLet me know!')
+        assert result["summary"] == "Great deals"
 
 
 class TestBuildDealsSummary:
@@ -187,7 +194,7 @@ class TestGenerateDigest:
             "highlights": ["AKL-NRT 35% below market", "SYD-LAX deal available"],
         })
 
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = AsyncMock(return_value=mock_response)
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 200,
@@ -203,7 +210,7 @@ class TestGenerateDigest:
     @pytest.mark.asyncio
     async def test_malformed_response_fallback(self):
         deals = [make_deal()]
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = AsyncMock(return_value="Great deals available today!")
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 200,
@@ -226,7 +233,7 @@ class TestGenerateDigest:
             captured_prompt = prompt
             return json.dumps({"summary": "Test summary", "highlights": []})
 
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = capture_prompt
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 200,
@@ -248,7 +255,7 @@ class TestExplainDeal:
             "verdict": "great_deal",
         })
 
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = AsyncMock(return_value=mock_response)
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 100,
@@ -264,7 +271,7 @@ class TestExplainDeal:
     @pytest.mark.asyncio
     async def test_malformed_response_fallback(self):
         deal = make_deal()
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = AsyncMock(return_value="This looks like a reasonable deal.")
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 100,
@@ -286,7 +293,7 @@ class TestExplainDeal:
             captured_prompt = prompt
             return json.dumps({"explanation": "Test", "verdict": "decent"})
 
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = capture_prompt
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 100,
@@ -314,7 +321,7 @@ class TestReviewSettings:
             "score": 7,
         })
 
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = AsyncMock(return_value=mock_response)
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 150,
@@ -331,7 +338,7 @@ class TestReviewSettings:
     @pytest.mark.asyncio
     async def test_malformed_response_fallback(self):
         settings = make_settings()
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = AsyncMock(return_value="Your configuration looks decent.")
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 150,
@@ -354,7 +361,7 @@ class TestReviewSettings:
             captured_prompt = prompt
             return json.dumps({"assessment": "Test", "suggestions": [], "score": 5})
 
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.complete = capture_prompt
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 150,
@@ -369,10 +376,63 @@ class TestReviewSettings:
         assert "JFK" in captured_prompt
 
 
+class TestBulkCalls:
+    @pytest.mark.asyncio
+    async def test_explain_bulk_bounded_and_ordered(self):
+        deals = [make_deal(id=i, parsed_destination=f"D{i:02d}") for i in range(6)]
+        active = 0
+        peak = 0
+
+        async def fake_complete(prompt, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            destination = prompt.split("Destination: ")[1][:3]
+            return json.dumps({"explanation": destination, "verdict": "decent"})
+
+        with patch("app.services.ai_deals.AIService") as MockAI:
+            MockAI.complete = fake_complete
+            MockAI.estimate_tokens.return_value = {
+                "input_tokens_est": 100,
+                "output_tokens_est": 300,
+                "cost_est_usd": 0.001,
+            }
+            results = await explain_deals_bulk(deals, concurrency=2)
+
+        assert [r["explanation"] for r in results] == [f"D{i:02d}" for i in range(6)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_digest_bulk_failure_becomes_fallback(self):
+        calls = 0
+
+        async def flaky_complete(prompt, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("rate limited")
+            return json.dumps({"summary": "Cheap flights", "highlights": []})
+
+        with patch("app.services.ai_deals.AIService") as MockAI:
+            MockAI.complete = flaky_complete
+            MockAI.estimate_tokens.return_value = {
+                "input_tokens_est": 100,
+                "output_tokens_est": 300,
+                "cost_est_usd": 0.001,
+            }
+            results = await generate_digests_bulk([[make_deal()], [make_deal()]], concurrency=1)
+
+        assert results[0]["summary"] == "Cheap flights"
+        assert results[1]["summary"] == ""
+        assert "rate limited" in results[1]["error"]
+
+
 class TestEstimateFunctions:
     def test_estimate_digest(self):
         deals = [make_deal(), make_deal(id=2)]
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 200,
                 "output_tokens_est": 300,
@@ -386,7 +446,7 @@ class TestEstimateFunctions:
 
     def test_estimate_explain(self):
         deal = make_deal()
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 100,
                 "output_tokens_est": 300,
@@ -400,7 +460,7 @@ class TestEstimateFunctions:
 
     def test_estimate_settings_review(self):
         settings = make_settings()
-        with patch("app.services.ai_service.AIService") as MockAI:
+        with patch("app.services.ai_deals.AIService") as MockAI:
             MockAI.estimate_tokens.return_value = {
                 "input_tokens_est": 150,
                 "output_tokens_est": 500,
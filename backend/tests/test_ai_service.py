@@ -11,6 +11,7 @@ from app.services.ai_service import (
     CacheEntry,
     COST_RATES,
     PROVIDER_DEFAULT_RATES,
+    parse_json_response,
 )
 
 
@@ -177,6 +178,17 @@ class TestCacheBehavior:
         assert AIService._get_cached("key1") is None
         assert AIService._get_cached("key2") is None
 
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """A full cache drops the entry that was used longest ago."""
+        monkeypatch.setattr(AIService, "_cache_max_entries", 2)
+        AIService._set_cached("key1", "r1")
+        AIService._set_cached("key2", "r2")
+        AIService._get_cached("key1")
+        AIService._set_cached("key3", "r3")
+        assert AIService._get_cached("key2") is None
+        assert AIService._get_cached("key1") == "r1"
+        assert AIService._get_cached("key3") == "r3"
+
     def test_set_cache_ttl(self):
         """set_cache_ttl changes the TTL."""
         AIService.set_cache_ttl(7200.0)
@@ -357,3 +369,13 @@ class TestConfigure:
         """Configuring without required API key leaves service unconfigured."""
         AIService.configure(AIProvider.OPENAI)  # No api_key
         assert not AIService.is_configured()
+
+
+class TestParseJsonResponse:
+    def test_plain_json_with_trailing_comma(self):
+        """Unfenced JSON followed by a stray comma still parses."""
+        assert parse_json_response('{"score": 7},\n') == {"score": 7}
+
+    def test_fenced_json_with_trailing_comma(self):
+        """Fence stripping and the trailing-comma retry combine."""
+        assert parse_json_response('```json\n{"score": 7},\n```') == {"score": 7}
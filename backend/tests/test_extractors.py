@@ -4,17 +4,40 @@ Tests for the flight data extraction pipeline.
 Tests FlightData confidence calculation, RowValidator, PriceValidator,
 bare number regex removal, and confidence gate thresholds.
 """
+import asyncio
+import dataclasses
 import pytest
 from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from playwright.async_api import Error as PlaywrightError
 
 from app.scrapers.extractors import (
     FlightData,
     PriceValidator,
     RowValidator,
     PriceExtractor,
+    AirlineValidator,
+    RowExtractor,
+    FlightRowLocator,
+    UnifiedExtractor,
+    FlightDetailsExtractor,
+    ExtractionResult,
+    _looks_like_year_in_date,
+    _validate_airline_normalized,
 )
 
 
+def _fields(text="", aria="", alt="", **data):
+    """Build a field record as returned by the in-page row probes."""
+    return {
+        "text": text, "aria": aria, "alt": alt,
+        "data_price": data.get("data_price", ""),
+        "data_value": data.get("data_value", ""),
+        "data_gs": data.get("data_gs", ""),
+    }
+
+
 class TestFlightDataConfidence:
     """Tests for FlightData.calculate_overall_confidence()."""
 
@@ -65,6 +88,11 @@ class TestFlightDataConfidence:
         # Only price_confidence counted
         assert result == 0.9
 
+    def test_price_confidence_always_counted(self):
+        """Price is always in the average, even at 0; other fields only when found."""
+        flight = FlightData(price=500, price_confidence=0.0, airline_confidence=0.8)
+        assert abs(flight.calculate_overall_confidence() - 0.4) < 1e-9
+
     def test_page_level_low_correlation(self):
         """Page-level fallback extraction should have low overall confidence."""
         flight = FlightData(
@@ -168,26 +196,30 @@ class TestPriceValidator:
         assert result.is_valid is False
         assert result.confidence < 0.5
 
+    def test_confidence_agrees_with_validate(self):
+        for price in (10, 100, 150, 800, 1000, 12000, 20000, 100000):
+            result = PriceValidator.validate(price)
+            confidence = PriceValidator.confidence(price)
+            assert bool(confidence) == result.is_valid
+            if result.is_valid:
+                assert confidence == result.confidence
+
 
 class TestYearInDateDetection:
     """Tests that bare numbers matching years are rejected when in date context."""
 
     def test_year_with_month_name_detected(self):
-        from app.scrapers.extractors import RowExtractor
-        assert RowExtractor._looks_like_year_in_date(2026, "Departs Mar 15, 2026") is True
+        assert _looks_like_year_in_date(2026, "Departs Mar 15, 2026") is True
 
     def test_year_with_full_month_detected(self):
-        from app.scrapers.extractors import RowExtractor
-        assert RowExtractor._looks_like_year_in_date(2026, "January 2026") is True
+        assert _looks_like_year_in_date(2026, "January 2026") is True
 
     def test_year_without_month_not_detected(self):
         """Bare '2026' without date context could be a price."""
-        from app.scrapers.extractors import RowExtractor
-        assert RowExtractor._looks_like_year_in_date(2026, "Total: 2026") is False
+        assert _looks_like_year_in_date(2026, "Total: 2026") is False
 
     def test_non_year_number_not_detected(self):
-        from app.scrapers.extractors import RowExtractor
-        assert RowExtractor._looks_like_year_in_date(500, "Mar 15, 500") is False
+        assert _looks_like_year_in_date(500, "Mar 15, 500") is False
 
     def test_price_2026_accepted_by_validator(self):
         """$2026 is a valid price — the year check is contextual, not in PriceValidator."""
@@ -361,3 +393,523 @@ class TestConfidenceGateClassification:
         # overall = 0.875 * 0.4 + 0.95 * 0.6 = 0.35 + 0.57 = 0.92
         from app.services.scraping_service import ScrapingService
         assert overall >= ScrapingService.MIN_CONFIDENCE_FOR_DEALS
+
+
+class TestStrategyLevelGrouping:
+    """Tests for grouping PriceExtractor strategies into per-level selector unions."""
+
+    def test_every_strategy_grouped_once(self):
+        grouped = [
+            s["name"]
+            for _, css, engine in PriceExtractor._STRATEGY_LEVELS
+            for s in css + engine
+        ]
+        assert sorted(grouped) == sorted(s["name"] for s in PriceExtractor.STRATEGIES)
+
+    def test_levels_ascending(self):
+        levels = [level for level, _, _ in PriceExtractor._STRATEGY_LEVELS]
+        assert levels == sorted(levels)
+
+    def test_playwright_only_selectors_not_in_union(self):
+        """text= and :has-text selectors can't go through querySelectorAll."""
+        for _, css, engine in PriceExtractor._STRATEGY_LEVELS:
+            for strategy in css:
+                assert not strategy["selector"].startswith("text=")
+                assert ":has-text(" not in strategy["selector"]
+        engine_names = {
+            s["name"] for _, _, engine in PriceExtractor._STRATEGY_LEVELS for s in engine
+        }
+        assert engine_names == {"text-nzd", "text-dollar"}
+
+    def test_has_text_strategy_joins_union_as_tag(self):
+        css = {s["name"]: s for _, css, _ in PriceExtractor._STRATEGY_LEVELS for s in css}
+        assert css["span-currency"]["selector"] == "span"
+        assert css["span-currency"]["has_text"] == "$"
+
+
+class TestParsePriceText:
+    """Tests for PriceExtractor._parse_price_text()."""
+
+    def test_nzd_prefix_with_comma(self):
+        result = PriceExtractor._parse_price_text("NZ$1,234 ", "data-gs", 0)
+        assert result.success is True
+        assert result.value == 1234
+        assert result.fallback_level == 0
+
+    def test_level_penalty_applied(self):
+        level_0 = PriceExtractor._parse_price_text("$850", "a", 0)
+        level_2 = PriceExtractor._parse_price_text("$850", "b", 2)
+        assert level_0.confidence > level_2.confidence
+
+    def test_no_currency_returns_none(self):
+        assert PriceExtractor._parse_price_text("Flight 747", "all-spans", 5) is None
+
+
+class TestCurrencyMarkerPrefilter:
+    """Tests for the currency-marker check run before the price patterns."""
+
+    def test_every_price_pattern_requires_a_marker(self):
+        for pattern, name in PriceExtractor.PRICE_PATTERNS:
+            assert any(
+                marker in pattern.pattern for marker in ("\\$", "NZD", "AUD", "€", "£")
+            ), name
+
+    def test_text_without_marker_skips_patterns(self):
+        assert PriceExtractor._parse_price_text("Air New Zealand 1234", "s", 0) is None
+        assert PriceExtractor._parse_price_text("1,234 NZD", "s", 0).value == 1234
+
+
+class TestPriceExtractorEarlyExit:
+    """Tests for skipping lower strategy levels once enough good prices are found."""
+
+    async def test_stops_after_high_confidence_level(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[
+            ["data-gs", _fields(f"NZ${price}")] for price in (500, 600, 700, 800, 900)
+        ])
+        page.eval_on_selector_all = AsyncMock(return_value=[])
+
+        results = await PriceExtractor.extract(page)
+
+        assert len(results) == 5
+        assert page.evaluate.await_count == 1
+        page.eval_on_selector_all.assert_not_awaited()
+
+    async def test_repeated_text_parsed_once(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[
+            ["data-gs", _fields("NZ$500")], ["aria-price", _fields("NZ$500")],
+            ["data-gs", _fields("NZ$600")],
+        ])
+        page.eval_on_selector_all = AsyncMock(return_value=[])
+
+        with patch.object(
+            PriceExtractor, "_parse_price_text", wraps=PriceExtractor._parse_price_text
+        ) as parse:
+            results = await PriceExtractor.extract(page)
+
+        assert sorted(r.value for r in results) == [500, 600]
+        assert parse.call_count == 2
+
+    async def test_continues_when_level_yields_too_few(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[["data-gs", _fields("NZ$500")]])
+        page.eval_on_selector_all = AsyncMock(return_value=[])
+
+        results = await PriceExtractor.extract(page)
+
+        assert [r.value for r in results] == [500]
+        assert page.evaluate.await_count == len(PriceExtractor._STRATEGY_LEVELS)
+
+
+class TestAirlineValidator:
+    """Tests for AirlineValidator."""
+
+    def test_known_airline(self):
+        result = AirlineValidator.validate("Air New Zealand")
+        assert result.is_valid is True
+        assert result.confidence == 0.95
+        assert result.value == "Air New Zealand"
+
+    def test_unknown_rejected(self):
+        assert AirlineValidator.validate("Unknown").is_valid is False
+        assert AirlineValidator.validate("").is_valid is False
+
+    def test_normalized_matches_validate(self):
+        """The cached helper with a pre-lowered name gives the same result."""
+        for name in ("Qantas", "Qantas Airways", "Fly Corp", "Zz Transport", "X"):
+            expected = AirlineValidator.validate(name)
+            result = _validate_airline_normalized(name, name.lower().strip())
+            assert result == expected
+
+    def test_repeat_names_hit_cache(self):
+        _validate_airline_normalized.cache_clear()
+        first = AirlineValidator.validate("Some Regional Carrier")
+        second = AirlineValidator.validate("Some Regional Carrier")
+        assert second is first
+        assert _validate_airline_normalized.cache_info().hits == 1
+
+    def test_cached_result_is_immutable(self):
+        result = AirlineValidator.validate("Qantas")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.confidence = 0.0
+        assert AirlineValidator.validate("Qantas").confidence == 0.95
+
+    def test_partial_match_both_directions(self):
+        """Known name inside the input, and input inside a known name."""
+        longer = AirlineValidator.validate("Qantas Airways")
+        assert longer.confidence == 0.85
+        assert longer.reason == "Partial match with qantas"
+
+        shorter = AirlineValidator.validate("Virgin")
+        assert shorter.confidence == 0.85
+        assert shorter.reason == "Partial match with virgin australia"
+
+
+class TestRowExtractorFieldQueries:
+    """Tests for RowExtractor's single-evaluate row extraction."""
+
+    @staticmethod
+    def _row(**fields):
+        raw = {name: [] for name, _, _ in RowExtractor._ROW_FIELDS}
+        raw.update(fields)
+        row = MagicMock()
+        row.evaluate = AsyncMock(return_value=raw)
+        return row
+
+    async def test_row_read_in_one_evaluate(self):
+        row = self._row(
+            price=[[0, _fields(text="NZ$1,250", data_price="1250")]],
+            airline=[[3, _fields(text="Air New Zealand")]],
+            stops=[[0, _fields(aria="Nonstop flight.")]],
+            duration=[[0, _fields(aria="Total duration 3 hr 45 min.")]],
+        )
+
+        flight = await RowExtractor.extract_from_row(row, "yR1fYc", 0)
+
+        row.evaluate.assert_awaited_once()
+        assert flight.price == 1250
+        assert flight.price_strategy == "row_[data-price]"
+        assert flight.airline == "Air New Zealand"
+        assert flight.stops == 0
+        assert flight.duration_minutes == 225
+        assert flight.extraction_method == "per_row"
+
+    async def test_extraction_summary_off_by_default(self, monkeypatch):
+        row = self._row(price=[[0, _fields(text="NZ$1,250")]])
+
+        monkeypatch.setattr("app.scrapers.extractors.EMIT_EXTRACTION_SUMMARY", False)
+        assert (await RowExtractor.extract_from_row(row, "yR1fYc", 0)).extraction_summary is None
+
+        monkeypatch.setattr("app.scrapers.extractors.EMIT_EXTRACTION_SUMMARY", True)
+        summary = (await RowExtractor.extract_from_row(row, "yR1fYc", 0)).extraction_summary
+        assert summary["extraction_method"] == "per_row"
+        assert summary["row_strategy"] == "yR1fYc"
+
+    async def test_emergency_price_used_when_no_currency(self):
+        row = self._row(
+            price=[[0, _fields(text="Select flight")]],
+            emergency_price=[[4, _fields(text="1250")]],
+        )
+
+        flight = await RowExtractor.extract_from_row(row, "yR1fYc", 0)
+
+        assert flight.price == 1250
+        assert flight.price_strategy == "row_emergency_[class*='price']"
+
+    async def test_no_price_returns_none(self):
+        row = self._row(airline=[[0, _fields(text="Qantas")]])
+        assert await RowExtractor.extract_from_row(row, "yR1fYc", 0) is None
+
+    def test_first_valid_candidate_wins(self):
+        """Candidates arrive in priority order; invalid ones are skipped."""
+        candidates = [
+            ("[data-carrier]", 0, _fields(aria="Operated by")),
+            ("[class*='carrier']", 1, _fields(text="Qantas")),
+            ("[class*='airline']", 1, _fields(text="Jetstar")),
+        ]
+
+        result = RowExtractor._extract_airline(candidates)
+
+        assert result.value == "Qantas"
+        assert result.strategy_name == "row_[class*='carrier']"
+
+    def test_stops_patterns_case_insensitive(self):
+        nonstop = RowExtractor._extract_stops([("[aria-label*='stop']", 0, _fields(text="Non-Stop"))])
+        two_stops = RowExtractor._extract_stops([("[aria-label*='stop']", 0, _fields(aria="2 Stops"))])
+
+        assert nonstop.value == 0
+        assert two_stops.value == 2
+
+
+class TestPriceTraversal:
+    """Tests for FlightRowLocator's in-page price-ancestor traversal."""
+
+    async def test_rows_unpacked_in_order(self):
+        row_a, row_b = MagicMock(name="row_a"), MagicMock(name="row_b")
+        properties = {}
+        for index, element in enumerate([row_a, None, row_b]):
+            prop = MagicMock()
+            prop.as_element.return_value = element
+            properties[str(index)] = prop
+        handle = MagicMock()
+        handle.get_properties = AsyncMock(return_value=properties)
+        handle.dispose = AsyncMock()
+        page = MagicMock()
+        page.evaluate_handle = AsyncMock(return_value=handle)
+
+        rows = await FlightRowLocator._find_rows_by_price_traversal(page)
+
+        assert rows == [row_a, row_b]
+        page.evaluate_handle.assert_awaited_once()
+        airline_selector = page.evaluate_handle.await_args.args[1][1]
+        assert airline_selector == FlightRowLocator._AIRLINE_INDICATOR_UNION
+        handle.dispose.assert_awaited_once()
+
+    async def test_evaluate_failure_returns_no_rows(self):
+        page = MagicMock()
+        page.evaluate_handle = AsyncMock(side_effect=PlaywrightError("navigated"))
+        assert await FlightRowLocator._find_rows_by_price_traversal(page) == []
+
+
+class TestPerRowConcurrency:
+    """Tests for UnifiedExtractor._extract_per_row() running rows concurrently."""
+
+    async def test_failed_rows_skipped_and_order_kept(self):
+        rows = ["row0", "row1", "row2", "row3"]
+        outcomes = {
+            "row0": FlightData(price=900, price_confidence=0.9),
+            "row1": Exception("detached"),
+            "row2": None,
+            "row3": FlightData(price=700, price_confidence=0.9),
+        }
+
+        async def fake_extract(row, strategy, level):
+            outcome = outcomes[row]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch.object(FlightRowLocator, "find_rows", AsyncMock(return_value=(rows, "yR1fYc", 0))), \
+                patch.object(RowExtractor, "extract_from_row", side_effect=fake_extract):
+            flights = await UnifiedExtractor._extract_per_row(MagicMock())
+
+        assert [f.price for f in flights] == [900, 700]
+
+    async def test_concurrency_bounded(self):
+        active = 0
+        peak = 0
+
+        async def fake_extract(row, strategy, level):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return None
+
+        rows = [f"row{i}" for i in range(UnifiedExtractor.ROW_CONCURRENCY * 3)]
+        with patch.object(FlightRowLocator, "find_rows", AsyncMock(return_value=(rows, "yR1fYc", 0))), \
+                patch.object(RowExtractor, "extract_from_row", side_effect=fake_extract):
+            await UnifiedExtractor._extract_per_row(MagicMock())
+
+        assert 1 < peak <= UnifiedExtractor.ROW_CONCURRENCY
+
+
+class TestExtractAllComparison:
+    """Tests for UnifiedExtractor.extract_all() strategy selection."""
+
+    async def test_page_level_skipped_when_per_row_succeeds(self, monkeypatch):
+        monkeypatch.setattr(UnifiedExtractor, "COMPARISON_SAMPLE_RATE", 0.0)
+        per_row = AsyncMock(return_value=[FlightData(price=500)])
+        page_level = AsyncMock(return_value=[FlightData(price=600)])
+        with patch.object(UnifiedExtractor, "_extract_per_row", per_row), \
+                patch.object(UnifiedExtractor, "_extract_page_level", page_level):
+            flights = await UnifiedExtractor.extract_all(MagicMock())
+
+        assert [f.price for f in flights] == [500]
+        page_level.assert_not_awaited()
+
+    async def test_comparison_runs_both_once(self, monkeypatch):
+        monkeypatch.setattr(UnifiedExtractor, "COMPARISON_SAMPLE_RATE", 1.0)
+        per_row = AsyncMock(return_value=[])
+        page_level = AsyncMock(return_value=[FlightData(price=600)])
+        with patch.object(UnifiedExtractor, "_extract_per_row", per_row), \
+                patch.object(UnifiedExtractor, "_extract_page_level", page_level):
+            flights = await UnifiedExtractor.extract_all(MagicMock())
+
+        assert [f.price for f in flights] == [600]
+        per_row.assert_awaited_once()
+        page_level.assert_awaited_once()
+
+
+class TestPageLevelPadding:
+    """Tests for _extract_page_level() padding shorter field lists."""
+
+    async def test_shorter_lists_repeat_last_and_empty_lists_stay_unset(self):
+        def result(value):
+            return ExtractionResult(
+                success=True, value=value, confidence=0.9,
+                strategy_name="s", fallback_level=0,
+            )
+
+        prices = AsyncMock(return_value=[result(500), result(600), result(700)])
+        airlines = AsyncMock(return_value=[result("Qantas"), result("Air New Zealand")])
+        stops = AsyncMock(return_value=[])
+        durations = AsyncMock(return_value=[result(180)])
+        with patch.object(PriceExtractor, "extract", prices), \
+                patch.object(FlightDetailsExtractor, "extract_airline", airlines), \
+                patch.object(FlightDetailsExtractor, "extract_stops", stops), \
+                patch.object(FlightDetailsExtractor, "extract_duration", durations):
+            flights = await UnifiedExtractor._extract_page_level(MagicMock())
+
+        assert [f.price for f in flights] == [500, 600, 700]
+        assert [f.airline for f in flights] == ["Qantas", "Air New Zealand", "Air New Zealand"]
+        assert [f.stops for f in flights] == [None, None, None]
+        assert [f.duration_minutes for f in flights] == [180, 180, 180]
+
+
+class TestPageLevelConcurrency:
+    """Tests for _extract_page_level() running its extractors together."""
+
+    async def test_failed_detail_extractor_leaves_field_unset(self):
+        price = ExtractionResult(
+            success=True, value=500, confidence=0.9, strategy_name="s", fallback_level=0,
+        )
+        with patch.object(PriceExtractor, "extract", AsyncMock(return_value=[price])), \
+                patch.object(FlightDetailsExtractor, "extract_airline",
+                             AsyncMock(side_effect=KeyError("text"))), \
+                patch.object(FlightDetailsExtractor, "extract_stops", AsyncMock(return_value=[])), \
+                patch.object(FlightDetailsExtractor, "extract_duration", AsyncMock(return_value=[])):
+            flights = await UnifiedExtractor._extract_page_level(MagicMock())
+
+        assert [(f.price, f.airline) for f in flights] == [(500, None)]
+
+
+class TestRowLocatorLevels:
+    """Tests for FlightRowLocator's one-query-per-level row discovery."""
+
+    def test_level_unions(self):
+        assert FlightRowLocator._LEVEL_UNIONS[0] == (
+            0, "yR1fYc+pIav2d", "li.yR1fYc, li[class*='pIav2d']"
+        )
+        assert FlightRowLocator._LEVEL_UNIONS[-1] == (3, "price-ancestor", None)
+
+    async def test_level_0_hit_is_single_query(self):
+        row_a, row_b = MagicMock(name="row_a"), MagicMock(name="row_b")
+        properties = {}
+        for index, element in enumerate([row_a, row_b]):
+            prop = MagicMock()
+            prop.as_element.return_value = element
+            properties[str(index)] = prop
+        handle = MagicMock()
+        handle.get_properties = AsyncMock(return_value=properties)
+        handle.dispose = AsyncMock()
+        page = MagicMock()
+        page.evaluate_handle = AsyncMock(return_value=handle)
+
+        rows, name, level = await FlightRowLocator.find_rows(page)
+
+        assert (rows, name, level) == ([row_a, row_b], "yR1fYc+pIav2d", 0)
+        page.evaluate_handle.assert_awaited_once()
+        selector, limit = page.evaluate_handle.await_args.args[1][:2]
+        assert selector == "li.yR1fYc, li[class*='pIav2d']"
+        assert limit == FlightRowLocator.MAX_ROW_CANDIDATES
+        handle.dispose.assert_awaited_once()
+
+    def test_has_text_indicators_split_out(self):
+        """querySelector can't run :has-text(), so it's checked separately in-page."""
+        css_union, text_checks = FlightRowLocator._PRICE_INDICATOR_CHECKS
+        assert ":has-text" not in css_union
+        assert "[data-price]" in css_union
+        assert text_checks == [["span", "$"]]
+
+
+class TestDetailStrategyProbe:
+    """Tests for FlightDetailsExtractor reading all CSS strategies in one call."""
+
+    async def test_airline_strategies_read_in_one_call(self):
+        strategies = FlightDetailsExtractor.AIRLINE_STRATEGIES
+        buckets = [[] for _ in strategies]
+        buckets[3] = [_fields("Air New Zealand")]
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=buckets)
+        page.eval_on_selector_all = AsyncMock()
+
+        results = await FlightDetailsExtractor.extract_airline(page)
+
+        assert [(r.value, r.strategy_name) for r in results] == [
+            ("Air New Zealand", strategies[3]["name"])
+        ]
+        page.evaluate.assert_awaited_once()
+        selectors, limit = page.evaluate.await_args.args[1]
+        assert selectors == [s["selector"] for s in strategies]
+        assert limit == FlightDetailsExtractor.MAX_ELEMENTS_PER_STRATEGY
+        page.eval_on_selector_all.assert_not_awaited()
+
+    async def test_text_strategies_queried_separately(self):
+        strategies = FlightDetailsExtractor.STOPS_STRATEGIES
+        css_count = sum(not s["selector"].startswith("text=") for s in strategies)
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[[] for _ in range(css_count)])
+        page.eval_on_selector_all = AsyncMock(
+            side_effect=[PlaywrightError("detached"), [_fields("Nonstop")], []]
+        )
+
+        results = await FlightDetailsExtractor.extract_stops(page)
+
+        assert [(r.value, r.strategy_name) for r in results] == [(0, "text-nonstop")]
+        assert page.eval_on_selector_all.await_count == len(strategies) - css_count
+
+    async def test_text_strategies_skipped_once_enough_found(self):
+        strategies = FlightDetailsExtractor.STOPS_STRATEGIES
+        css_count = sum(not s["selector"].startswith("text=") for s in strategies)
+        buckets = [[] for _ in range(css_count)]
+        buckets[0] = [_fields("Nonstop")] * FlightDetailsExtractor.EARLY_EXIT_MIN_RESULTS
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=buckets)
+        page.eval_on_selector_all = AsyncMock(return_value=[])
+
+        results = await FlightDetailsExtractor.extract_stops(page)
+
+        assert len(results) == FlightDetailsExtractor.EARLY_EXIT_MIN_RESULTS
+        page.eval_on_selector_all.assert_not_awaited()
+
+    async def test_failed_probe_still_reads_text_strategies(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=PlaywrightError("navigated"))
+        page.eval_on_selector_all = AsyncMock(return_value=[_fields("5 hr 30 min")])
+
+        results = await FlightDetailsExtractor.extract_duration(page)
+
+        assert {r.value for r in results} == {330}
+
+
+class TestMemoizedParsers:
+    """Tests for the memoized FlightDetailsExtractor string parsers."""
+
+    def test_parse_duration(self):
+        assert FlightDetailsExtractor._parse_duration("5 hr 30 min") == 330
+        assert FlightDetailsExtractor._parse_duration("12h") == 720
+        assert FlightDetailsExtractor._parse_duration("") is None
+
+    def test_clean_airline_name(self):
+        assert FlightDetailsExtractor._clean_airline_name("Operated by Qantas QF25") == "Qantas"
+        assert FlightDetailsExtractor._clean_airline_name("") is None
+
+    def test_clean_airline_name_strips_numbers_and_times_in_one_pass(self):
+        clean = FlightDetailsExtractor._clean_airline_name
+        assert clean("Marketed by Air New Zealand NZ1 10:30 am") == "Air New Zealand"
+        # Flight numbers are matched case-sensitively, as before
+        assert clean("Virgin Australia va123") == "Virgin Australia va123"
+
+    def test_repeat_calls_hit_cache(self):
+        FlightDetailsExtractor._parse_duration.cache_clear()
+        FlightDetailsExtractor._parse_duration("3 hr 45 min")
+        FlightDetailsExtractor._parse_duration("3 hr 45 min")
+        assert FlightDetailsExtractor._parse_duration.cache_info().hits == 1
+
+    def test_long_text_parsed_without_caching(self):
+        FlightDetailsExtractor._parse_duration.cache_clear()
+        text = "Departs Auckland " * 20 + "11 hr 5 min"
+        assert FlightDetailsExtractor._parse_duration(text) == 665
+        assert FlightDetailsExtractor._parse_duration.cache_info().currsize == 0
+
+
+class TestSlottedDataclasses:
+    """Extraction dataclasses are slotted to keep per-instance memory small."""
+
+    def test_flight_data_is_slotted(self):
+        flight = FlightData(price=500)
+        assert not hasattr(flight, "__dict__")
+        with pytest.raises(AttributeError):
+            flight.not_a_field = 1
+
+    def test_result_types_are_slotted(self):
+        validation = PriceValidator.validate(800)
+        extraction = ExtractionResult(
+            success=True, value=800, confidence=0.9,
+            strategy_name="s", fallback_level=0, validation=validation,
+        )
+        assert not hasattr(validation, "__dict__")
+        assert not hasattr(extraction, "__dict__")
@@ -0,0 +1,388 @@
+"""
+Tests for the Google Flights scraper: browser/context pooling and batched routes.
+
+Playwright is mocked throughout; no real browser is launched.
+"""
+import asyncio
+import gzip
+import re
+import pytest
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.scrapers import google_flights
+from app.scrapers.google_flights import (
+    ContextPool, FlightResult, GoogleFlightsScraper, RouteCircuitBreaker, ScrapeResult,
+)
+
+
+def _mock_playwright():
+    """Build a mocked async_playwright() whose launches hand out fresh browsers."""
+    def new_browser(*args, **kwargs):
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+
+        def new_context(**kwargs):
+            context = AsyncMock()
+            context.browser = browser
+            return context
+
+        browser.new_context = AsyncMock(side_effect=new_context)
+        browser.close = AsyncMock()
+        return browser
+
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(side_effect=new_browser)
+    playwright.stop = AsyncMock()
+    starter = MagicMock()
+    starter.start = AsyncMock(return_value=playwright)
+    return MagicMock(return_value=starter), playwright
+
+
+@pytest.fixture(autouse=True)
+def fresh_browser(monkeypatch):
+    """Each test starts without a shared driver, browser, pooled contexts or open circuits."""
+    monkeypatch.setattr(google_flights, "_playwright", None)
+    monkeypatch.setattr(google_flights, "_browser", None)
+    monkeypatch.setattr(google_flights, "_browser_lock", asyncio.Lock())
+    monkeypatch.setattr(google_flights, "_context_pool", ContextPool(2))
+    monkeypatch.setattr(google_flights, "_route_breaker", RouteCircuitBreaker())
+
+
+def _make_scraper(tmp_path, name="scraper"):
+    return GoogleFlightsScraper(
+        screenshots_dir=tmp_path / name / "shots",
+        html_dir=tmp_path / name / "html",
+        state_path=tmp_path / name / "state.json",
+    )
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    return _make_scraper(tmp_path)
+
+
+class TestBrowserLifecycle:
+    """One browser per process; warm contexts handed out by a bounded pool."""
+
+    async def test_context_reused_between_scrapes(self, scraper):
+        pool = google_flights._context_pool
+        factory, playwright = _mock_playwright()
+        with patch("app.scrapers.google_flights.async_playwright", factory):
+            first = await pool.acquire(scraper._create_context)
+            pool.release(first)
+            second = await pool.acquire(scraper._create_context)
+
+        assert first is second
+        assert playwright.chromium.launch.await_count == 1
+
+    async def test_pool_waits_when_exhausted(self, scraper):
+        pool = google_flights._context_pool
+        factory, _ = _mock_playwright()
+        with patch("app.scrapers.google_flights.async_playwright", factory):
+            first = await pool.acquire(scraper._create_context)
+            await pool.acquire(scraper._create_context)
+            waiter = asyncio.create_task(pool.acquire(scraper._create_context))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+            pool.release(first)
+            assert await waiter is first
+
+    async def test_context_of_crashed_browser_is_replaced(self, scraper):
+        pool = google_flights._context_pool
+        factory, playwright = _mock_playwright()
+        with patch("app.scrapers.google_flights.async_playwright", factory):
+            first = await pool.acquire(scraper._create_context)
+            pool.release(first)
+            first.browser.is_connected.return_value = False
+            second = await pool.acquire(scraper._create_context)
+
+        assert first is not second
+        assert second.browser is not first.browser
+        assert playwright.chromium.launch.await_count == 2
+
+    async def test_failed_create_frees_its_slot(self):
+        pool = ContextPool(1)
+        with pytest.raises(RuntimeError):
+            await pool.acquire(AsyncMock(side_effect=RuntimeError("launch failed")))
+
+        context = AsyncMock()
+        assert await pool.acquire(AsyncMock(return_value=context)) is context
+
+    async def test_concurrent_first_scrapes_launch_once(self, scraper):
+        pool = google_flights._context_pool
+        factory, playwright = _mock_playwright()
+        with patch("app.scrapers.google_flights.async_playwright", factory):
+            contexts = await asyncio.gather(
+                *(pool.acquire(scraper._create_context) for _ in range(2))
+            )
+
+        assert contexts[0] is not contexts[1]
+        assert contexts[0].browser is contexts[1].browser
+        assert playwright.chromium.launch.await_count == 1
+
+    async def test_connects_over_cdp_when_configured(self, scraper, monkeypatch):
+        factory, playwright = _mock_playwright()
+        remote = MagicMock()
+        playwright.chromium.connect_over_cdp = AsyncMock(return_value=remote)
+        monkeypatch.setattr(google_flights, "CHROMIUM_CDP_URL", "ws://chromium:9222")
+        with patch("app.scrapers.google_flights.async_playwright", factory):
+            browser = await google_flights.get_browser(scraper.BROWSER_ARGS)
+
+        assert browser is remote
+        playwright.chromium.connect_over_cdp.assert_awaited_once_with("ws://chromium:9222")
+        playwright.chromium.launch.assert_not_awaited()
+
+    async def test_scrape_route_returns_context_when_page_fails(self, scraper):
+        pool = ContextPool(1)
+        context = MagicMock()
+        context.browser.is_connected.return_value = True
+        context.new_page = AsyncMock(side_effect=RuntimeError("target closed"))
+        scraper._create_context = AsyncMock(return_value=context)
+
+        with patch.object(google_flights, "_context_pool", pool):
+            with pytest.raises(RuntimeError):
+                await scraper.scrape_route(1, "AKL", "SYD", None, None)
+            assert await asyncio.wait_for(pool.acquire(scraper._create_context), 1) is context
+
+    async def test_shutdown_closes_pool_browser_and_driver(self, scraper, tmp_path):
+        other = _make_scraper(tmp_path, "other")
+        pool = google_flights._context_pool
+        factory, playwright = _mock_playwright()
+        with patch("app.scrapers.google_flights.async_playwright", factory):
+            mine = await pool.acquire(scraper._create_context)
+            theirs = await pool.acquire(other._create_context)
+        pool.release(mine)
+        pool.release(theirs)
+        await scraper.close()
+
+        assert mine.browser is theirs.browser
+        mine.close.assert_not_awaited()
+
+        await google_flights.shutdown_browser()
+        mine.close.assert_awaited_once()
+        theirs.close.assert_awaited_once()
+        mine.browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+
+
+class TestScrapeRoutes:
+    """scrape_routes() bounds concurrency and keeps job order."""
+
+    async def test_bounded_and_ordered(self, scraper):
+        active = 0
+        peak = 0
+
+        async def fake_scrape(**job):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return ScrapeResult(status="success", error_message=job["origin"])
+
+        scraper.scrape_route = fake_scrape
+        jobs = [{"origin": f"O{i}", "destination": "AKL"} for i in range(7)]
+
+        results = await scraper.scrape_routes(jobs, max_parallel=2)
+
+        assert [r.error_message for r in results] == [j["origin"] for j in jobs]
+        assert peak == 2
+
+    async def test_failed_job_becomes_unknown_result(self, scraper):
+        async def fake_scrape(**job):
+            if job["origin"] == "BAD":
+                raise RuntimeError("browser gone")
+            return ScrapeResult(status="success")
+
+        scraper.scrape_route = fake_scrape
+        results = await scraper.scrape_routes(
+            [{"origin": "AKL", "destination": "SYD"}, {"origin": "BAD", "destination": "SYD"}]
+        )
+
+        assert [r.status for r in results] == ["success", "unknown"]
+        assert "browser gone" in results[1].error_message
+
+
+class TestPageChecks:
+    """Captcha, block and no-results detection share a single in-page probe."""
+
+    async def test_one_evaluate_for_all_checks(self, scraper):
+        status = {"captcha": False, "blocked": True, "no_results": False}
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=status)
+        page.query_selector = AsyncMock()
+        page.content = AsyncMock()
+
+        assert await scraper._probe_page_status(page) == status
+        page.evaluate.assert_awaited_once()
+        selector, blocked_source, no_results_source = page.evaluate.await_args.args[1]
+        assert all(s in selector for s in scraper.CAPTCHA_SELECTORS)
+        assert blocked_source == scraper._BLOCKED_PATTERN_SOURCE
+        assert no_results_source == scraper._NO_RESULTS_PATTERN_SOURCE
+        page.query_selector.assert_not_awaited()
+        page.content.assert_not_awaited()
+
+    @pytest.mark.parametrize("source,patterns", [
+        ("_BLOCKED_PATTERN_SOURCE", "BLOCKED_PATTERNS"),
+        ("_NO_RESULTS_PATTERN_SOURCE", "NO_RESULTS_PATTERNS"),
+    ])
+    def test_pattern_source_matches_every_pattern(self, scraper, source, patterns):
+        regex = re.compile(getattr(scraper, source), re.IGNORECASE)
+        for pattern in getattr(scraper, patterns):
+            assert regex.search(f"Sorry... {pattern.upper()}.")
+        assert not regex.search("Cheapest flights from Auckland")
+
+    async def test_probe_failure_fails_open(self, scraper):
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=RuntimeError("navigated away"))
+
+        assert await scraper._probe_page_status(page) == {
+            "captcha": False, "blocked": False, "no_results": False,
+        }
+
+
+class TestCircuitBreaker:
+    """Routes Google keeps blocking are skipped without touching the browser."""
+
+    async def test_opens_after_threshold_and_skips_browser(self, scraper):
+        scraper._scrape_route = AsyncMock(return_value=ScrapeResult(status="captcha"))
+
+        for _ in range(3):
+            await scraper.scrape_route(1, "AKL", "SYD", None, None)
+        result = await scraper.scrape_route(1, "AKL", "SYD", None, None)
+
+        assert result.status == "circuit_open"
+        assert scraper._scrape_route.await_count == 3
+
+        await scraper.scrape_route(1, "AKL", "MEL", None, None)
+        assert scraper._scrape_route.await_count == 4
+
+    def test_cooldown_doubles_on_reopen_and_success_resets(self, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr(google_flights.time, "monotonic", lambda: now)
+        monkeypatch.setattr(google_flights.random, "uniform", lambda a, b: 1.0)
+        breaker = RouteCircuitBreaker(failure_threshold=2, base_cooldown_s=60)
+        route = ("AKL", "SYD")
+
+        breaker.record(route, "blocked")
+        assert not breaker.is_open(route)
+        breaker.record(route, "blocked")
+        assert breaker.is_open(route)
+
+        now += 61
+        assert not breaker.is_open(route)  # trial scrape allowed
+        breaker.record(route, "timeout")
+        now += 61
+        assert breaker.is_open(route)  # re-opened for 120s
+        now += 60
+        assert not breaker.is_open(route)
+
+        breaker.record(route, "success")
+        breaker.record(route, "blocked")
+        assert not breaker.is_open(route)
+
+    def test_only_one_trial_after_cooldown(self, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr(google_flights.time, "monotonic", lambda: now)
+        monkeypatch.setattr(google_flights.random, "uniform", lambda a, b: 1.0)
+        breaker = RouteCircuitBreaker(failure_threshold=1, base_cooldown_s=60, trial_timeout_s=30)
+        route = ("AKL", "SYD")
+        breaker.record(route, "captcha")
+
+        now += 61
+        assert not breaker.is_open(route)  # first caller gets the trial
+        assert breaker.is_open(route)  # concurrent callers are held off
+
+        now += 31
+        assert not breaker.is_open(route)  # unreported trial expired; new trial
+        breaker.record(route, "layout_change")
+        assert not breaker.is_open(route)
+        assert not breaker.is_open(route)
+
+    def test_non_pushback_failures_ignored(self):
+        breaker = RouteCircuitBreaker(failure_threshold=1)
+        for status in ("layout_change", "no_results", "unknown"):
+            breaker.record(("AKL", "SYD"), status)
+        assert not breaker.is_open(("AKL", "SYD"))
+
+
+class TestFailureArtifacts:
+    """_save_failure_artifacts() sizes screenshots to the failure reason."""
+
+    async def test_screenshot_scope_by_reason(self, scraper):
+        page = MagicMock()
+        page.screenshot = AsyncMock()
+        page.content = AsyncMock(return_value="<html></html>")
+
+        for reason in ("captcha", "layout_change", "no_results"):
+            await scraper._save_failure_artifacts(page, 1, reason)
+
+        calls = page.screenshot.await_args_list
+        assert [c.kwargs["full_page"] for c in calls] == [False, True]
+        assert all(c.kwargs["type"] == "jpeg" for c in calls)
+
+    async def test_no_results_saves_html_only(self, scraper):
+        page = MagicMock()
+        page.screenshot = AsyncMock()
+        page.content = AsyncMock(return_value="<html>no flights found</html>")
+
+        screenshot_path, html_path = await scraper._save_failure_artifacts(page, 1, "no_results")
+
+        assert screenshot_path is None and html_path is not None
+        page.screenshot.assert_not_awaited()
+
+    async def test_html_snapshot_is_gzipped(self, scraper):
+        page = MagicMock()
+        page.screenshot = AsyncMock()
+        page.content = AsyncMock(return_value="<html>no flights found</html>")
+
+        _, html_path = await scraper._save_failure_artifacts(page, 1, "no_results")
+
+        assert html_path.endswith(".html.gz")
+        with gzip.open(html_path, "rt", encoding="utf-8") as f:
+            assert f.read() == "<html>no flights found</html>"
+
+
+class TestRequestFilter:
+    """Media and tracker requests are aborted; page data is let through."""
+
+    @pytest.mark.parametrize("resource_type,url,blocked", [
+        ("image", "https://www.gstatic.com/flights/logo.png", True),
+        ("font", "https://fonts.gstatic.com/s/roboto.woff2", True),
+        ("script", "https://www.googletagmanager.com/gtag/js", True),
+        ("xhr", "https://stats.g.doubleclick.net/collect", True),
+        ("document", "https://www.google.com/travel/flights?q=x", False),
+        ("xhr", "https://www.google.com/_/FlightsFrontendUi/data", False),
+        ("stylesheet", "https://www.gstatic.com/flights/app.css", False),
+        ("script", "https://notdoubleclick.net/app.js", False),
+    ])
+    def test_is_blocked_request(self, resource_type, url, blocked):
+        assert GoogleFlightsScraper._is_blocked_request(resource_type, url) is blocked
+
+    async def test_filter_installed_on_new_context(self, scraper):
+        factory, _ = _mock_playwright()
+        with patch("app.scrapers.google_flights.async_playwright", factory):
+            context = await scraper._create_context()
+
+        context.route.assert_awaited_once_with("**/*", scraper._filter_request)
+
+
+class TestResultTypes:
+    """Result dataclasses are slotted; flight rows are immutable once built."""
+
+    def test_scrape_result_is_slotted(self):
+        result = ScrapeResult(status="success")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unexpected = 1
+
+    def test_flight_result_is_frozen(self):
+        flight = FlightResult(
+            price_nzd=Decimal("899"), airline="Air NZ", stops=0, duration_minutes=180,
+            departure_time="08:00", arrival_time="11:00", raw_data={},
+        )
+        with pytest.raises(FrozenInstanceError):
+            flight.price_nzd = Decimal("1")